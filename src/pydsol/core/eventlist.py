@@ -104,12 +104,22 @@ class EventListHeap(EventListInterface):
     Note the minus sign in front of priority. This is because a HIGHER 
     priority means an EARLIER event. This is consistent with the comparison
     methods in the ``SimEvent`` class.
+    
+    Removing an event from the middle of a heap is expensive, so removal
+    is lazy: the id of a removed event is recorded, and the event is
+    skipped when it reaches the front of the heap. When more than half of
+    the heap consists of removed events, the heap is rebuilt without them.
+    An event should be stored at most once on the event list.
     """
 
     def __init__(self):
         """Create a new, empty event list."""
         self._event_list: list[SimEventInterface] = []
         heapq.heapify(self._event_list)
+        # the ids of all events in the heap, including the removed ones
+        self._ids: set[int] = set()
+        # the ids of the removed events that are still in the heap
+        self._removed: set[int] = set()
     
     def add(self, event: SimEventInterface):
         """Store an event on the event list.
@@ -119,8 +129,22 @@ class EventListHeap(EventListInterface):
         event : SimEventInterface
             The event to store on the event list.
         """
+        if event._id in self._removed:
+            # the removed event is still in the heap, so it can be revived
+            self._removed.discard(event._id)
+            return
         heapq.heappush(self._event_list, (event.time, -event.priority,
                                           event._id, event))
+        self._ids.add(event._id)
+    
+    def _prune(self):
+        """Pop the removed events from the front of the heap."""
+        heap = self._event_list
+        removed = self._removed
+        while heap and heap[0][2] in removed:
+            event_id = heapq.heappop(heap)[2]
+            removed.discard(event_id)
+            self._ids.discard(event_id)
     
     def peek_first(self) -> SimEventInterface:
         """Return the first event from the event list without removing it.
@@ -132,7 +156,9 @@ class EventListHeap(EventListInterface):
             priority and lowest id in case priorities also tie) from the event 
             list. In case the event list is empty, None is returned.
         """
-        if self.is_empty():
+        if self._removed:
+            self._prune()
+        if not self._event_list:
             return None
         return self._event_list[0][3]
 
@@ -146,9 +172,13 @@ class EventListHeap(EventListInterface):
             priority and lowest id in case priorities also tie) from the event 
             list. In case the event list is empty, None is returned.
         """
-        if self.is_empty():
+        if self._removed:
+            self._prune()
+        if not self._event_list:
             return None
-        return heapq.heappop(self._event_list)[3]
+        entry = heapq.heappop(self._event_list)
+        self._ids.discard(entry[2])
+        return entry[3]
 
     def size(self) -> int:
         """Return the number of events on the event list.
@@ -158,7 +188,7 @@ class EventListHeap(EventListInterface):
         int
             The number of events on the event list as an int..
         """
-        return len(self._event_list)
+        return len(self._event_list) - len(self._removed)
 
     def contains(self, event: SimEventInterface) -> bool:
         """Return whether the event list contains the event.
@@ -173,10 +203,7 @@ class EventListHeap(EventListInterface):
         bool
             True or False, depending on whether the event is in the event list.
         """
-        if self.is_empty():
-            return False
-        return self._event_list.count((event.time, -event.priority,
-                                       event._id, event)) > 0
+        return event._id in self._ids and event._id not in self._removed
         
     def remove(self, event: SimEventInterface) -> bool:
         """Remove the event from the event list and return success.
@@ -192,11 +219,18 @@ class EventListHeap(EventListInterface):
             True or False, depending on whether the event was present in 
             the event list.
         """
-        if (self.contains(event)):
-            self._event_list.remove((event.time, -event.priority,
-                                     event._id, event))
-            return True
-        return False
+        if not self.contains(event):
+            return False
+        self._removed.add(event._id)
+        if len(self._removed) * 2 > len(self._event_list):
+            # rebuild the heap when it consists mostly of removed events
+            removed = self._removed
+            self._event_list[:] = [e for e in self._event_list 
+                                   if e[2] not in removed]
+            heapq.heapify(self._event_list)
+            self._ids -= removed
+            removed.clear()
+        return True
 
     def is_empty(self) -> bool:
         """ Return whether the event list is empty.
@@ -211,10 +245,14 @@ class EventListHeap(EventListInterface):
     def clear(self):
         """Remove all events from the event list."""
         self._event_list.clear()
+        self._ids.clear()
+        self._removed.clear()
         
     def __str__(self) -> str:
         s = "["
         for e in self._event_list:
+            if e[2] in self._removed:
+                continue
             s += "(" + str(e[0]) + ", " + str(-e[1]) + ") "
         s += "]"
         return s
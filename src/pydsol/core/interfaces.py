@@ -263,6 +263,9 @@ class InputParameterInterface(ABC):
     properties that an InputParameter should have. The definition of the
     interface avoids circular references. 
     """
+    
+    # no instance dict, so InputParameter classes can use __slots__
+    __slots__ = ()
 
     @property
     @abstractmethod
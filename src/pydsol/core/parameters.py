@@ -17,8 +17,14 @@ parameters, e.g., from the screen, a web page, an Excel file, a properties
 file, or a JSON file.        
 """
 
+from __future__ import annotations
+
+from bisect import insort
+from functools import lru_cache
 import math
-from typing import Union, Dict, Type, List
+from operator import attrgetter
+import sys
+from typing import Union, Dict, Type, List, Iterable, Tuple
 
 from pydsol.core.units import Quantity
 from pydsol.core.utils import get_module_logger
@@ -38,6 +44,78 @@ __all__ = [
 
 logger = get_module_logger('parameters')
 
+# default bounds of the int, float and quantity parameters; unbounded 
+# parameters share the _UNBOUNDED tuple, so the range check can be skipped
+# with an identity test
+_NEG_INF = -math.inf
+_POS_INF = math.inf
+_UNBOUNDED = (_NEG_INF, _POS_INF)
+
+
+@lru_cache(maxsize=64)
+def _is_number_type(t: type) -> bool:
+    """
+    Return whether values of type t are accepted as numbers. The result is
+    cached per type, so the subclass check is only done once for each type.
+    """
+    return issubclass(t, (int, float))
+
+
+@lru_cache(maxsize=64)
+def _format_function(format_str: str):
+    """
+    Return the bound `%` operator of the format string. Parameters with the
+    same (interned) format string share one bound method.
+    """
+    return format_str.__mod__
+
+
+@lru_cache(maxsize=None)
+def _unit_names(quantity: Type[Quantity]) -> List[str]:
+    """
+    Return the interned unit names of a quantity type. The list is computed
+    once per quantity type and shared by all unit parameters, so it should
+    not be changed; InputParameterSelectionList copies the options anyway.
+    """
+    return [sys.intern(unit) for unit in quantity._units]
+
+
+def _make_type_check(value_type):
+    """
+    Return a type check for the given type or tuple of types. An exact type 
+    match is tested first with a set lookup; isinstance is only called for 
+    subclasses of the types. Although bool is a subclass of int, a bool is
+    rejected unless bool is one of the given types.
+    """
+    exact = frozenset(value_type if isinstance(value_type, tuple) 
+                      else (value_type,))
+    if bool in exact:
+        def _is_value_type(value) -> bool:
+            return type(value) in exact or isinstance(value, value_type)
+    else:
+        def _is_value_type(value) -> bool:
+            return type(value) in exact or (isinstance(value, value_type)
+                                            and not isinstance(value, bool))
+    return _is_value_type
+
+
+def _make_bounds(lo: float, hi: float) -> Tuple[float, float]:
+    """
+    Return the bounds tuple of a parameter; the shared _UNBOUNDED tuple 
+    when both bounds are infinite.
+    """
+    if lo == _NEG_INF and hi == _POS_INF:
+        return _UNBOUNDED
+    return (lo, hi)
+
+
+def _in_range(bounds: Tuple[float, float], x: float) -> bool:
+    """Return whether lo <= x <= hi (inclusive) for the bounds (lo, hi)."""
+    if bounds is _UNBOUNDED:
+        return True
+    lo, hi = bounds
+    return lo <= x <= hi
+
 
 class InputParameter(InputParameterInterface):
     """
@@ -81,8 +159,26 @@ class InputParameter(InputParameterInterface):
         The actual value of the parameter. The value is initialized with
         default_value and is updated based on user input or data input.
         The actual type will be defined in subclasses of `InputParameter`.
+    _extended_key_cache: str
+        The cached extended key of the parameter, or None when it has not 
+        been calculated yet or when a parent in the chain has changed.
     """
     
+    __slots__ = ('_key', '_name', '_description', '_default_value',
+                 '_display_priority', '_read_only', '_value', '_parent',
+                 '_extended_key_cache')
+    
+    def __init_subclass__(cls, **kwargs):
+        """
+        Build the type check for a subclass that defines its own _value_type
+        once, when the class is created. Subclasses without a _value_type
+        inherit the type check of their parent class.
+        """
+        super().__init_subclass__(**kwargs)
+        if '_value_type' in cls.__dict__:
+            cls._is_value_type = staticmethod(
+                _make_type_check(cls._value_type))
+    
     def __init__(self, key: str, name: str, default_value,
                  display_priority: Union[int, float], *,
                  parent: "InputParameterMap"=None, description: str=None,
@@ -142,27 +238,49 @@ class InputParameter(InputParameterInterface):
         TypeError
             when read_only is not a bool
         """
+        self._validate(key, name, display_priority, parent, read_only)
+        self._set_attributes(key, name, default_value, display_priority,
+                             parent, description, read_only)
+
+    @staticmethod
+    def _validate(key: str, name: str, display_priority: float,
+                  parent: "InputParameterMap", read_only: bool):
+        """
+        Check the arguments of the `InputParameter` constructor, and raise
+        the errors that are documented for `__init__`.
+        """
         if not isinstance(key, str):
             raise TypeError(f"parameter key {key} not a string")
-        if len(key) == 0:
-            raise ValueError("parameter key length 0")
-        if '.' in key:
-            raise ValueError(f"parameter key {key} contains a period")
         if not isinstance(name, str):
             raise TypeError(f"parameter name {name} not a string")
-        if len(name) == 0:
-            raise ValueError("parameter name length 0")
-        if not (isinstance(display_priority, float) 
-                or isinstance(display_priority, int)):
+        if not _is_number_type(type(display_priority)):
             raise TypeError(f"priority {display_priority} not a float/int")
-        if parent is not None and not isinstance(parent, InputParameterMap):
+        if parent is not None \
+                and not isinstance(parent, InputParameterMap):
             raise TypeError("parent not an InputParamterMap")
         if not isinstance(read_only, bool):
             raise TypeError(f"parameter read_only {read_only} not a bool")
-        self._key: str = key
-        self._name: str = name
+        if len(key) == 0:
+            raise ValueError("parameter key length 0")
+        if '.' in key:
+            raise ValueError(f"parameter key {key} contains a period")
+        if len(name) == 0:
+            raise ValueError("parameter name length 0")
+
+    def _set_attributes(self, key: str, name: str, default_value,
+                        display_priority: float, parent: "InputParameterMap",
+                        description: str, read_only: bool):
+        """
+        Set the attributes of the `InputParameter` without any checks, and
+        add the parameter to its parent.
+        """
+        # names and descriptions often repeat across sub-maps; share them
+        self._key: str = sys.intern(key)
+        self._name: str = sys.intern(name)
         if description == None:
             self._description: str = ""
+        elif type(description) is str:
+            self._description: str = sys.intern(description)
         else:
             self._description: str = description
         self._default_value = default_value
@@ -170,11 +288,40 @@ class InputParameter(InputParameterInterface):
         self._read_only: bool = read_only
         self._value = default_value
         self._parent: "InputParameterMap" = parent
+        self._extended_key_cache: str = None
         if parent is not None:
             # will take care of error for duplicate keys
             parent.add(self)
-    
-    @property    
+
+    @classmethod
+    def _create_unchecked(cls, key: str, name: str, default_value,
+                          display_priority: float, parent: "InputParameterMap",
+                          description: str, read_only: bool):
+        """
+        Create a new InputParameter without validating the arguments. This
+        is meant for readers that have already validated a batch of
+        parameters, e.g., from a JSON file. Only the attributes of
+        `InputParameter` are set, so subclasses that add attributes in 
+        their __slots__ cannot be created this way. The parameter is added 
+        to the parent, which still checks for duplicate keys.
+        
+        Raises
+        ------
+        TypeError
+            when the class adds attributes to those of `InputParameter`
+        """
+        for c in cls.__mro__:
+            if c is InputParameter:
+                break
+            if c.__dict__.get('__slots__'):
+                raise TypeError(f"{cls.__name__} cannot be created " + \
+                                "without its own initialization")
+        param = cls.__new__(cls)
+        param._set_attributes(key, name, default_value, display_priority,
+                              parent, description, read_only)
+        return param
+
+    @property
     def key(self) -> str:
         """
         Return the key of the parameter that can be a part of the 
@@ -202,10 +349,24 @@ class InputParameter(InputParameterInterface):
             The extended key of this InputParameter including parents 
             with a dot-notation.
         """
-        if self._parent == None:
-            return self._key
-        else:
-            return self._parent.extended_key() + '.' + self._key
+        if self._extended_key_cache is None:
+            # walk up iteratively until the root or a node with a cached key
+            parts = []
+            node = self
+            while node is not None and node._extended_key_cache is None:
+                parts.append(node._key)
+                node = node._parent
+            if node is not None:
+                parts.append(node._extended_key_cache)
+            parts.reverse()
+            self._extended_key_cache = '.'.join(parts)
+        return self._extended_key_cache
+
+    def _invalidate_extended_key(self):
+        """
+        Clear the cached extended key, e.g., because the parent changed.
+        """
+        self._extended_key_cache = None
 
     @property    
     def name(self) -> str:
@@ -249,9 +410,9 @@ class InputParameter(InputParameterInterface):
         """
         return self._default_value
 
-    @property    
-    def value(self) -> object:
-        """
+    # the value is read very often during a run; attrgetter is a C-level
+    # getter that avoids a Python function call for every read
+    value = property(attrgetter('_value'), doc="""
         Returns the actual value of the parameter. The value is initialized
         with default_value and is updated based on user input or data input.
         The actual type will be defined in subclasses of `InputParameter`.
@@ -260,8 +421,7 @@ class InputParameter(InputParameterInterface):
         -------
         object
             The actual value of the parameter.
-        """
-        return self._value
+        """)
 
     def set_value(self, value: object):
         """
@@ -277,8 +437,10 @@ class InputParameter(InputParameterInterface):
         ValueError
             when parameter is read-only
         """
-        if self.read_only:
-            raise ValueError("parameter {self.key} is read only")
+        if self._read_only:
+            # the message is built when raising, which is rare; storing it
+            # would cost an extra slot on every parameter instance
+            raise ValueError(f"parameter {self._key} is read only")
         self._value = value
 
     @property    
@@ -326,42 +488,51 @@ class InputParameter(InputParameterInterface):
         """
         return self._parent
 
+    # the comparisons are duck-typed on _display_priority; returning 
+    # NotImplemented makes Python fall back to identity for == and != and
+    # raise a TypeError for the ordering operators
     def __eq__(self, other): 
-        if not isinstance(other, InputParameter):
-            return False
-        return self.display_priority == other.display_priority 
+        try:
+            return self._display_priority == other._display_priority
+        except AttributeError:
+            return NotImplemented
 
     def __ne__(self, other): 
-        if not isinstance(other, InputParameter):
-            return True
-        return self.display_priority != other.display_priority 
+        try:
+            return self._display_priority != other._display_priority
+        except AttributeError:
+            return NotImplemented
 
     def __gt__(self, other): 
-        if not isinstance(other, InputParameter):
-            raise TypeError(f"cannot compare parameter with {other}")
-        return self.display_priority > other.display_priority 
+        try:
+            return self._display_priority > other._display_priority
+        except AttributeError:
+            return NotImplemented
 
     def __ge__(self, other): 
-        if not isinstance(other, InputParameter):
-            raise TypeError(f"cannot compare parameter with {other}")
-        return self.display_priority >= other.display_priority 
+        try:
+            return self._display_priority >= other._display_priority
+        except AttributeError:
+            return NotImplemented
 
     def __lt__(self, other): 
-        if not isinstance(other, InputParameter):
-            raise TypeError(f"cannot compare parameter with {other}")
-        return self.display_priority < other.display_priority 
+        try:
+            return self._display_priority < other._display_priority
+        except AttributeError:
+            return NotImplemented
 
     def __le__(self, other): 
-        if not isinstance(other, InputParameter):
-            raise TypeError(f"cannot compare parameter with {other}")
-        return self.display_priority <= other.display_priority 
+        try:
+            return self._display_priority <= other._display_priority
+        except AttributeError:
+            return NotImplemented
 
     def __str__(self) -> str:
         return self.extended_key() + " [" + self.name + "] = " \
             +str(self.value)
     
     def __repr__(self) -> str:
-        return str(self)
+        return f"<{type(self).__name__} {self.extended_key()}>"
     
 
 class InputParameterMap(InputParameter):
@@ -374,8 +545,24 @@ class InputParameterMap(InputParameter):
     
     The `InputParameterMap` has all attributes of the `InputParameter`. 
     The `_value` attribute is of the type `dict[str, InputParameter]`. 
+    It also has the following extra attributes:
+    
+    Attributes
+    ----------
+    _order: list[tuple[float, int, str]]
+        The sorted (display_priority, sequence number, key) tuples of the 
+        parameters in the map, which determine the order of `_value`.
+    _seq: int
+        The sequence number for the next parameter that is added, to keep
+        the insertion order for parameters with the same display_priority.
+    _get_cache: dict[str, InputParameter]
+        The parameters that have been retrieved with `get`, keyed on the
+        (dotted) key string. The cache is cleared for this map and all its
+        parents when a parameter is added to or removed from the map.
     """
     
+    __slots__ = ('_order', '_seq', '_get_cache')
+    
     def __init__(self, key: str, name: str, display_priority: float, *,
                  parent: "InputParameterMap"=None, description: str=None):
         """
@@ -430,10 +617,11 @@ class InputParameterMap(InputParameter):
                          parent=parent, description=description,
                          read_only=True)
         self._value: Dict[str, InputParameter] = {}
+        self._order: List[Tuple[float, int, str]] = []
+        self._seq: int = 0
+        self._get_cache: Dict[str, InputParameter] = {}
 
-    @property    
-    def value(self) -> Dict[str, InputParameter]:
-        """
+    value = property(attrgetter('_value'), doc="""
         Returns the dict defined in this `InputParameterMap`, 
         which is the value.
         
@@ -441,8 +629,7 @@ class InputParameterMap(InputParameter):
         -------
         dict[str, InputParameter]
             The dict defined in this `InputParameterMap`.
-        """
-        return self._value
+        """)
 
     def set_value(self, value):
         """
@@ -458,6 +645,27 @@ class InputParameterMap(InputParameter):
             when called.
         """
         raise NotImplementedError("InputParameterMap value cannot be set")
+
+    def _invalidate_extended_key(self):
+        """
+        Clear the cached extended key of the map and of all parameters in
+        the map and its sub-maps.
+        """
+        self._extended_key_cache = None
+        # _value is still None while the map itself is being constructed
+        if self._value:
+            for param in self._value.values():
+                param._invalidate_extended_key()
+
+    def _clear_get_cache(self):
+        """
+        Clear the cache of `get` for this map and its parents, since the 
+        parents can have cached dotted keys that point into this map.
+        """
+        node = self
+        while node is not None:
+            node._get_cache.clear()
+            node = node._parent
     
     def add(self, input_parameter: InputParameter):
         """
@@ -479,13 +687,62 @@ class InputParameterMap(InputParameter):
         """
         if not isinstance(input_parameter, InputParameter):
             raise TypeError("input parameter not of the correct type")
-        if input_parameter.key in self._value.keys():
-            raise ValueError(f"duplicate key {input_parameter.key} in map {self}")
+        if input_parameter._key in self._value:
+            raise ValueError(f"duplicate key {input_parameter.key} in map " \
+                             + self.extended_key())
         input_parameter._parent = self
-        self._value[input_parameter.key] = input_parameter
-        # sort on the defined ordering in InputParameter after adding
-        self._value = {k: v for k, v in sorted(self._value.items(),
-                       key=lambda item: item[1])}
+        input_parameter._invalidate_extended_key()
+        key = input_parameter._key
+        entry = (input_parameter._display_priority, self._seq, key)
+        self._seq += 1
+        insort(self._order, entry)
+        if self._order[-1] is entry:
+            # highest priority so far: appending keeps the dict sorted
+            self._value[key] = input_parameter
+        else:
+            self._value[key] = input_parameter
+            self._value = {k: self._value[k] for _, _, k in self._order}
+        self._clear_get_cache()
+
+    def bulk_add(self, input_parameters: Iterable[InputParameter]):
+        """
+        Add a batch of input parameters to the map, e.g., from a reader for
+        a JSON file. All parameters are checked before the map is changed,
+        and the members of the map are sorted only once based on the 
+        display_priorities.
+        
+        Parameters
+        ----------
+        input_parameters: Iterable[InputParameter]
+            The input parameters to add to the map.
+            
+        Raises
+        ------
+        TypeError
+            when one of the input_parameters is not an InputParameter.
+        ValueError
+            when one of the input parameters has a key that is already 
+            present in the map or in the batch
+        """
+        input_parameters = list(input_parameters)
+        seen = set(self._value)
+        for input_parameter in input_parameters:
+            if not isinstance(input_parameter, InputParameter):
+                raise TypeError("input parameter not of the correct type")
+            if input_parameter._key in seen:
+                raise ValueError(f"duplicate key {input_parameter.key} " + \
+                                 f"in map {self.extended_key()}")
+            seen.add(input_parameter._key)
+        for input_parameter in input_parameters:
+            input_parameter._parent = self
+            input_parameter._invalidate_extended_key()
+            self._value[input_parameter._key] = input_parameter
+            self._order.append((input_parameter._display_priority, self._seq,
+                                input_parameter._key))
+            self._seq += 1
+        self._order.sort()
+        self._value = {k: self._value[k] for _, _, k in self._order}
+        self._clear_get_cache()
     
     def get(self, key: str) -> InputParameter:
         """
@@ -506,17 +763,28 @@ class InputParameterMap(InputParameter):
         KeyError
             when a sub-part of the key does not point to an InputParameterMap
         """
-        if '.' in key:
-            parts = key.split('.')
-            if not parts[0] in self._value:
-                raise KeyError(f"could not find parameter {parts[0]} in {self}")
-            if not isinstance(self._value[parts[0]], InputParameterMap):
-                raise KeyError(f"Key {parts[0]} does not point at a submap")
-            return self._value[parts[0]].get(key[key.find('.') + 1:])
-        else:
-            if not key in self._value:
-                raise KeyError(f"could not find parameter {key} in {self}")
-            return self._value[key]
+        param = self._get_cache.get(key)
+        if param is None:
+            param = self._get_parts([sys.intern(p) for p in key.split('.')], 0)
+            self._get_cache[key] = param
+        return param
+
+    def _get_parts(self, parts: List[str], i: int) -> InputParameter:
+        """
+        Return the input parameter for the key parts[i:] from this map, 
+        where the key has already been split on the dots.
+        """
+        part = parts[i]
+        # one dict lookup; a parameter in the map is never None
+        param = self._value.get(part)
+        if param is None:
+            raise KeyError(f"could not find parameter {part} in " \
+                           + self.extended_key())
+        if i == len(parts) - 1:
+            return param
+        if not isinstance(param, InputParameterMap):
+            raise KeyError(f"Key {part} does not point at a submap")
+        return param._get_parts(parts, i + 1)
     
     def remove(self, key) -> InputParameter:
         """
@@ -539,14 +807,27 @@ class InputParameterMap(InputParameter):
         KeyError
             when a sub-part of the key does not point to an InputParameterMap
         """
-        if '.' in key:
-            parts = key.split('.')
-            if not parts[0] in self._value:
-                raise KeyError(f"could not find parameter {parts[0]} in {self}")
-            if not isinstance(self._value[parts[0]], InputParameterMap):
-                raise KeyError(f"Key {parts[0]} does not point at a submap")
-            return self._value[parts[0]].remove(key[key.find('.') + 1:])
-        return self._value.pop(key) 
+        return self._remove_parts([sys.intern(p) for p in key.split('.')], 0)
+
+    def _remove_parts(self, parts: List[str], i: int) -> InputParameter:
+        """
+        Remove the input parameter for the key parts[i:] from this map, 
+        where the key has already been split on the dots.
+        """
+        key = parts[i]
+        if i < len(parts) - 1:
+            submap = self._value.get(key)
+            if submap is None:
+                raise KeyError(f"could not find parameter {key} in " \
+                               + self.extended_key())
+            if not isinstance(submap, InputParameterMap):
+                raise KeyError(f"Key {key} does not point at a submap")
+            return submap._remove_parts(parts, i + 1)
+        param = self._value.pop(key)
+        param._invalidate_extended_key()
+        self._order = [e for e in self._order if e[2] != key]
+        self._clear_get_cache()
+        return param
         
     def print_values(self, *, depth:int=0) -> str:
         """
@@ -566,14 +847,32 @@ class InputParameterMap(InputParameter):
             A string with the keys and values of the map, including sub-maps
             and their parameters.
         """
-        s = ""
+        lines = []
+        self._print_values(lines, depth)
+        return ''.join(lines)
+
+    def _print_values(self, lines: List[str], depth: int):
+        """
+        Append the lines for this map and its sub-maps to lines, so the
+        string for the whole tree is only joined once.
+        """
+        indent = depth * ' '
         for key, param in self._value.items():
             if isinstance(param, InputParameterMap):
-                s += f"{depth * ' '}MAP: {key}\n"
-                s += param.print_values(depth=depth + 2)
+                lines.append(f"{indent}MAP: {key}\n")
+                param._print_values(lines, depth + 2)
             else: 
-                s += f"{depth * ' '}{key} = {param.value}\n"
-        return s
+                lines.append(f"{indent}{key} = {param._value}\n")
+
+    # only list the keys of the direct members, so that formatting a map, 
+    # e.g., for logging, does not stringify the entire parameter tree
+    def __str__(self) -> str:
+        return self.extended_key() + " [" + self.name + "] = [" \
+            + ", ".join(self._value) + "]"
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.extended_key()} " \
+            + "[" + ", ".join(self._value) + "]>"
 
 
 class InputParameterInt(InputParameter):
@@ -587,21 +886,30 @@ class InputParameterInt(InputParameter):
     
     Attributes
     ----------
-    _min: int
-        The lowest value (inclusive) that can be entered for this parameter.
-    _max: int
-        The highest value (inclusive) that can be entered for this parameter.
+    _bounds: tuple[int, int]
+        The lowest and highest value (inclusive) that can be entered for 
+        this parameter. A bound that has not been set is stored as -inf or
+        +inf, and a parameter without bounds shares the _UNBOUNDED tuple.
     _format: str
         The formatting string that is used in the user interface and when
         printing the parameter, e.g. to limit the number of decimals,
-        to indicate the + or - sign, etc.
+        to indicate the + or - sign, etc. The attribute is only set when
+        the format differs from the class default `_DEFAULT_FORMAT`.
     """
 
+    # the allowed type(s) of the value, checked in __init__ and set_value
+    _value_type = int
+
+    # the format string that is used when no _format has been set
+    _DEFAULT_FORMAT = "%d"
+
+    __slots__ = ('_bounds', '_format')
+
     def __init__(self, key: str, name: str, default_value: int,
                  display_priority: float, *,
                  parent: "InputParameterMap"=None, description: str=None,
                  read_only: bool=False,
-                 min_value:int=-math.inf, max_value:int=math.inf,
+                 min_value:int=None, max_value:int=None,
                  format_str:str="%d"):
         """
         Create a new InputParameterInt that can contain an integer input
@@ -640,10 +948,10 @@ class InputParameterInt(InputParameter):
             changed).
         min_value: int (optional)
             The lowest value (inclusive) that can be entered for this
-            parameter.
+            parameter. The default None means that there is no lower bound.
         max_value: int (optional)
             The highest value (inclusive) that can be entered for this
-            parameter.
+            parameter. The default None means that there is no upper bound.
         format_str: str (optional)
             The formatting string that is used in the user interface and when
             printing the parameter, e.g. to limit the number of decimals,
@@ -670,7 +978,7 @@ class InputParameterInt(InputParameter):
         TypeError
             when default_value is not an int
         TypeError
-            when min_value or max_value is not an int or float
+            when min_value or max_value is not an int, float or None
         TypeError
             when format_str is not a string
         ValueError
@@ -678,29 +986,37 @@ class InputParameterInt(InputParameter):
         ValueError
             when default value not between min_value and max_value (inclusive)
         """
-        super().__init__(key, name, default_value, display_priority,
-                         parent=parent, description=description,
-                         read_only=read_only)
-        if not isinstance(default_value, int):
+        if not self._is_value_type(default_value):
             raise TypeError(f"default value {default_value} is not an int")
-        if not isinstance(min_value, (int, float)):
-            raise TypeError(f"min value {min_value} is not an int or float")
-        if not isinstance(max_value, (int, float)):
-            raise TypeError(f"max value {max_value} is not an int or float")
+        # bool is a subclass of int, but not a valid bound
+        if not (min_value is None or (type(min_value) is not bool
+                and _is_number_type(type(min_value)))):
+            raise TypeError(f"min value {min_value} " + \
+                            f"is not an int or float")
+        if not (max_value is None or (type(max_value) is not bool
+                and _is_number_type(type(max_value)))):
+            raise TypeError(f"max value {max_value} " + \
+                            f"is not an int or float")
         if not isinstance(format_str, str):
             raise TypeError(f"format string {format_str} is not a str")
-        if min_value >= max_value:
+        if min_value is not None and max_value is not None \
+                and min_value >= max_value:
             raise ValueError(f"min {min_value} >= max {max_value}")
-        if not min_value <= default_value <= max_value:
+        self._bounds: Tuple[int, int] = _make_bounds(
+            _NEG_INF if min_value is None else min_value,
+            _POS_INF if max_value is None else max_value)
+        if not _in_range(self._bounds, default_value):
             raise ValueError(f"default value {default_value} not between " + \
-                             f"{min_value} and {max_value}")
-        self._min: int = min_value
-        self._max: int = max_value
-        self._format: str = format_str
+                             f"{self.min_value} and {self.max_value}")
+        if format_str != self._DEFAULT_FORMAT:
+            self._format: str = sys.intern(format_str)
+        # the base class adds the parameter to the parent map, so it is
+        # only initialized after the checks of this class have passed
+        super().__init__(key, name, default_value, display_priority,
+                         parent=parent, description=description,
+                         read_only=read_only)
         
-    @property    
-    def value(self) -> int:
-        """
+    value = property(attrgetter('_value'), doc="""
         Returns the actual value of the parameter. The value is initialized
         with default_value and is updated based on user input or data input.
         
@@ -708,8 +1024,7 @@ class InputParameterInt(InputParameter):
         -------
         int
             The actual value of the parameter.
-        """
-        return self._value
+        """)
 
     @property
     def min_value(self) -> int:
@@ -719,9 +1034,10 @@ class InputParameterInt(InputParameter):
         Returns
         -------
         int
-            The minimum allowed value of the parameter.
+            The minimum allowed value of the parameter, or -math.inf when 
+            there is no lower bound.
         """
-        return self._min
+        return self._bounds[0]
     
     @property
     def max_value(self) -> int:
@@ -731,9 +1047,10 @@ class InputParameterInt(InputParameter):
         Returns
         -------
         int
-            The maximum allowed value of the parameter.
+            The maximum allowed value of the parameter, or math.inf when 
+            there is no upper bound.
         """
-        return self._max
+        return self._bounds[1]
     
     @property
     def format_str(self) -> str:
@@ -745,7 +1062,20 @@ class InputParameterInt(InputParameter):
         str
             The defined format string of the parameter value.
         """
-        return self._format
+        return getattr(self, '_format', self._DEFAULT_FORMAT)
+
+    def format_value(self) -> str:
+        """
+        Returns the actual value of the parameter, formatted with the
+        format string of the parameter.
+        
+        Returns
+        -------
+        str
+            The formatted value of the parameter.
+        """
+        return _format_function(
+            getattr(self, '_format', self._DEFAULT_FORMAT))(self._value)
     
     def set_value(self, value: int):
         """
@@ -765,15 +1095,41 @@ class InputParameterInt(InputParameter):
         ValueError
             if the new value is not between the min_value and max_value
         """
-        if self.read_only:
-            raise ValueError(f"parameter {self.key} is read only")
-        if not isinstance(value, int):
+        if self._read_only:
+            raise ValueError(f"parameter {self._key} is read only")
+        # exact type test first; the full check also rejects a bool
+        if type(value) is not int and not self._is_value_type(value):
             raise TypeError(f"parameter value {value} not an int")
-        if not self._min <= value <= self._max:
-            raise ValueError(f"parameter value {value} not between " + \
-                             f"{self._min} and {self._max}")
+        if not _in_range(self._bounds, value):
+            raise self._range_error(value)
         self._value = value
 
+    def _range_error(self, value: int) -> ValueError:
+        """
+        Return the error for a value outside the bounds. Building the message
+        here keeps the string formatting out of `set_value`.
+        """
+        return ValueError(f"parameter value {value} not between " + \
+                          f"{self.min_value} and {self.max_value}")
+
+    def validate(self, value: int) -> bool:
+        """
+        Return whether the value would be accepted by `set_value`, apart 
+        from the read-only flag, without raising an error. The range check
+        is skipped for a parameter without bounds.
+        
+        Parameters
+        ----------
+        value: int
+            The candidate value of the parameter.
+        
+        Returns
+        -------
+        bool
+            Whether the value is an int between min_value and max_value.
+        """
+        return self._is_value_type(value) and _in_range(self._bounds, value)
+
         
 class InputParameterFloat(InputParameter):
     """
@@ -786,21 +1142,30 @@ class InputParameterFloat(InputParameter):
     
     Attributes
     ----------
-    _min: float
-        The lowest value (inclusive) that can be entered for this parameter.
-    _max: float
-        The highest value (inclusive) that can be entered for this parameter.
+    _bounds: tuple[float, float]
+        The lowest and highest value (inclusive) that can be entered for 
+        this parameter. A parameter without bounds shares the _UNBOUNDED 
+        tuple.
     _format: str
         The formatting string that is used in the user interface and when
         printing the parameter, e.g. to limit the number of decimals,
-        to indicate the + or - sign, etc.
+        to indicate the + or - sign, etc. The attribute is only set when
+        the format differs from the class default `_DEFAULT_FORMAT`.
     """
 
+    # the allowed type(s) of the value, checked in __init__ and set_value
+    _value_type = (float, int)
+
+    # the format string that is used when no _format has been set
+    _DEFAULT_FORMAT = "%.2f"
+
+    __slots__ = ('_bounds', '_format')
+
     def __init__(self, key: str, name: str, default_value: float,
                  display_priority: float, *,
                  parent: "InputParameterMap"=None, description: str=None,
                  read_only: bool=False,
-                 min_value:float=-math.inf, max_value:float=math.inf,
+                 min_value:float=_NEG_INF, max_value:float=_POS_INF,
                  format_str:str="%.2f"):
         """
         Create a new InputParameterFloat that can contain an float input
@@ -877,16 +1242,16 @@ class InputParameterFloat(InputParameter):
         ValueError
             when default value not between min_value and max_value (inclusive)
         """
-        super().__init__(key, name, default_value, display_priority,
-                         parent=parent, description=description,
-                         read_only=read_only)
-        if not (isinstance(default_value, float) or 
-                isinstance(default_value, int)):
-            raise TypeError(f"default value {default_value} is not float/int")
-        if not isinstance(min_value, (int, float)):
-            raise TypeError(f"min value {min_value} is not an int or float")
-        if not isinstance(max_value, (int, float)):
-            raise TypeError(f"max value {max_value} is not an int or float")
+        # the type check of the class also rejects a bool
+        if not self._is_value_type(default_value):
+            raise TypeError(f"default value {default_value} " + \
+                            f"is not float/int")
+        if not self._is_value_type(min_value):
+            raise TypeError(f"min value {min_value} " + \
+                            f"is not an int or float")
+        if not self._is_value_type(max_value):
+            raise TypeError(f"max value {max_value} " + \
+                            f"is not an int or float")
         if not isinstance(format_str, str):
             raise TypeError(f"format string {format_str} is not a str")
         if min_value >= max_value:
@@ -894,13 +1259,14 @@ class InputParameterFloat(InputParameter):
         if not min_value <= default_value <= max_value:
             raise ValueError(f"default value {default_value} not between " + \
                              f"{min_value} and {max_value}")
-        self._min: float = min_value
-        self._max: float = max_value
-        self._format: str = format_str
+        self._bounds: Tuple[float, float] = _make_bounds(min_value, max_value)
+        if format_str != self._DEFAULT_FORMAT:
+            self._format: str = sys.intern(format_str)
+        super().__init__(key, name, default_value, display_priority,
+                         parent=parent, description=description,
+                         read_only=read_only)
         
-    @property    
-    def value(self) -> float:
-        """
+    value = property(attrgetter('_value'), doc="""
         Returns the actual value of the parameter. The value is initialized
         with default_value and is updated based on user input or data input.
         
@@ -908,8 +1274,7 @@ class InputParameterFloat(InputParameter):
         -------
         float
             The actual value of the parameter.
-        """
-        return self._value
+        """)
 
     @property
     def min_value(self) -> float:
@@ -921,7 +1286,7 @@ class InputParameterFloat(InputParameter):
         float
             The minimum allowed value of the parameter.
         """
-        return self._min
+        return self._bounds[0]
     
     @property
     def max_value(self) -> float:
@@ -933,7 +1298,7 @@ class InputParameterFloat(InputParameter):
         float
             The maximum allowed value of the parameter.
         """
-        return self._max
+        return self._bounds[1]
     
     @property
     def format_str(self) -> str:
@@ -945,7 +1310,20 @@ class InputParameterFloat(InputParameter):
         str
             The defined format string of the parameter value.
         """
-        return self._format
+        return getattr(self, '_format', self._DEFAULT_FORMAT)
+
+    def format_value(self) -> str:
+        """
+        Returns the actual value of the parameter, formatted with the
+        format string of the parameter.
+        
+        Returns
+        -------
+        str
+            The formatted value of the parameter.
+        """
+        return _format_function(
+            getattr(self, '_format', self._DEFAULT_FORMAT))(self._value)
 
     def set_value(self, value: float):
         """
@@ -965,15 +1343,103 @@ class InputParameterFloat(InputParameter):
         ValueError
             if the new value is not between the min_value and max_value
         """
-        if self.read_only:
-            raise ValueError(f"parameter {self.key} is read only")
-        if not isinstance(value, (float, int)):
+        if self._read_only:
+            raise ValueError(f"parameter {self._key} is read only")
+        # exact type tests first; the full check also rejects a bool
+        t = type(value)
+        if t is not float and t is not int and not self._is_value_type(value):
             raise TypeError(f"parameter value {value} not a number")
-        if not self._min <= value <= self._max:
-            raise ValueError(f"parameter value {value} not between " + \
-                             f"{self._min} and {self._max}")
+        if not _in_range(self._bounds, value):
+            raise self._range_error(value)
         self._value = value
 
+    def _range_error(self, value: float) -> ValueError:
+        """
+        Return the error for a value outside the bounds. Building the message
+        here keeps the string formatting out of `set_value`.
+        """
+        lo, hi = self._bounds
+        return ValueError(f"parameter value {value} not between " + \
+                          f"{lo} and {hi}")
+
+    @classmethod
+    def validate_batch(cls, params: List["InputParameterFloat"],
+                       values: Iterable[float]) -> List[bool]:
+        """
+        Check a batch of candidate values against the bounds of the 
+        corresponding parameters in one call, e.g., for the values of a 
+        scenario sweep. The values are not stored, and the read-only flag
+        is not checked.
+        
+        Parameters
+        ----------
+        params: List[InputParameterFloat]
+            The parameters whose bounds are used.
+        values: Iterable[float]
+            The candidate values, in the same order as params.
+            
+        Returns
+        -------
+        list[bool]
+            For each candidate value, whether it is a number that lies 
+            between the min_value and max_value (inclusive) of its parameter.
+            
+        Raises
+        ------
+        ValueError
+            if the number of values differs from the number of parameters
+        """
+        values = list(values)
+        if len(values) != len(params):
+            raise ValueError(f"{len(values)} values given for " + \
+                             f"{len(params)} parameters")
+        return [(type(v) is float or p._is_value_type(v)) 
+                and _in_range(p._bounds, v)
+                for v, p in zip(values, params)]
+
+    @classmethod
+    def set_values_bulk(cls, params: List["InputParameterFloat"],
+                        values: Iterable[float]):
+        """
+        Set the values of a number of float parameters at once, e.g., when
+        loading a scenario file. All values are checked before any value is
+        set, so either all parameters are updated or none of them.
+        
+        Parameters
+        ----------
+        params: List[InputParameterFloat]
+            The parameters to update.
+        values: Iterable[float]
+            The new values, in the same order as params.
+            
+        Raises
+        ------
+        ValueError
+            if the number of values differs from the number of parameters
+        ValueError
+            if one of the parameters is read-only
+        TypeError
+            if one of the new values is not a number
+        ValueError
+            if one of the new values is not between its min_value and 
+            max_value
+        """
+        values = list(values)
+        if len(values) != len(params):
+            raise ValueError(f"{len(values)} values given for " + \
+                             f"{len(params)} parameters")
+        for param, value in zip(params, values):
+            if param._read_only:
+                raise ValueError(f"parameter {param._key} is read only")
+            t = type(value)
+            if t is not float and t is not int \
+                    and not param._is_value_type(value):
+                raise TypeError(f"parameter value {value} not a number")
+            if not _in_range(param._bounds, value):
+                raise param._range_error(value)
+        for param, value in zip(params, values):
+            param._value = value
+
         
 class InputParameterStr(InputParameter):
     """
@@ -983,6 +1449,11 @@ class InputParameterStr(InputParameter):
     The `_value` attribute is of the type `str`.
     """
 
+    # the allowed type(s) of the value, checked in __init__ and set_value
+    _value_type = str
+
+    __slots__ = ()
+
     def __init__(self, key: str, name: str, default_value: str,
                  display_priority: float, *,
                  parent: "InputParameterMap"=None, description: str=None,
@@ -1044,15 +1515,13 @@ class InputParameterStr(InputParameter):
         TypeError
             when default_value is not a string
         """
+        if not self._is_value_type(default_value):
+            raise TypeError(f"default value {default_value} is not a str")
         super().__init__(key, name, default_value, display_priority,
                          parent=parent, description=description,
                          read_only=read_only)
-        if not isinstance(default_value, str):
-            raise TypeError(f"default value {default_value} is not a str")
 
-    @property    
-    def value(self) -> str:
-        """
+    value = property(attrgetter('_value'), doc="""
         Returns the actual value of the parameter. The value is initialized
         with default_value and is updated based on user input or data input.
         
@@ -1060,8 +1529,7 @@ class InputParameterStr(InputParameter):
         -------
         str
             The actual value of the parameter.
-        """
-        return self._value
+        """)
 
     def set_value(self, value: str):
         """
@@ -1074,10 +1542,15 @@ class InputParameterStr(InputParameter):
             
         Raises
         ------
-        TypeError
+        ValueError
+            if the parameter is read-only
+        ValueError
             if the new value is not a str
         """
-        if not isinstance(value, str):
+        if self._read_only:
+            raise ValueError(f"parameter {self._key} is read only")
+        # exact type test first; the full check handles str subclasses
+        if type(value) is not str and not self._is_value_type(value):
             raise ValueError(f"parameter value {value} not a str")
         self._value = value
 
@@ -1090,6 +1563,11 @@ class InputParameterBool(InputParameter):
     The `_value` attribute is of the type `bool`.
     """
 
+    # the allowed type(s) of the value, checked in __init__ and set_value
+    _value_type = bool
+
+    __slots__ = ()
+
     def __init__(self, key: str, name: str, default_value: bool,
                  display_priority: float, *,
                  parent: "InputParameterMap"=None, description: str=None,
@@ -1151,15 +1629,13 @@ class InputParameterBool(InputParameter):
         TypeError
             when default_value is not a bool
         """
+        if not self._is_value_type(default_value):
+            raise TypeError(f"default value {default_value} is not a bool")
         super().__init__(key, name, default_value, display_priority,
                          parent=parent, description=description,
                          read_only=read_only)
-        if not isinstance(default_value, bool):
-            raise TypeError(f"default value {default_value} is not a bool")
 
-    @property    
-    def value(self) -> bool:
-        """
+    value = property(attrgetter('_value'), doc="""
         Returns the actual value of the parameter. The value is initialized
         with default_value and is updated based on user input or data input.
         
@@ -1167,8 +1643,7 @@ class InputParameterBool(InputParameter):
         -------
         bool
             The actual value of the parameter.
-        """
-        return self._value
+        """)
 
     def set_value(self, value: bool):
         """
@@ -1186,9 +1661,9 @@ class InputParameterBool(InputParameter):
         TypeError
             if the new value is not a boolean
         """
-        if self.read_only:
-            raise ValueError(f"parameter {self.key} is read only")
-        if not isinstance(value, bool):
+        if self._read_only:
+            raise ValueError(f"parameter {self._key} is read only")
+        if not self._is_value_type(value):
             raise TypeError(f"parameter value {value} not a bool")
         self._value = value
 
@@ -1207,23 +1682,30 @@ class InputParameterQuantity(InputParameter):
     
     Attributes
     ----------
-    _min_si: float
-        The lowest value (inclusive) that can be entered for this parameter.
-        It is stored in the SI unit or base unit.
-    _max_si: float
-        The highest value (inclusive) that can be entered for this parameter.
-        It is stored in the SI unit or base unit.
+    _bounds: tuple[float, float]
+        The lowest and highest value (inclusive) that can be entered for 
+        this parameter, stored in the SI unit or base unit. A parameter 
+        without bounds shares the _UNBOUNDED tuple.
     _format: str
         The formatting string that is used in the user interface and when
         printing the parameter, e.g. to limit the number of decimals,
-        to indicate the + or - sign, etc.    
+        to indicate the + or - sign, etc. The attribute is only set when
+        the format differs from the class default `_DEFAULT_FORMAT`.    
     """
 
+    # the allowed type(s) of the default value, checked in __init__
+    _value_type = Quantity
+
+    # the format string that is used when no _format has been set
+    _DEFAULT_FORMAT = "%.2f"
+
+    __slots__ = ('_bounds', '_format', '_type')
+
     def __init__(self, key: str, name: str, default_value: Quantity,
                  display_priority: float, *,
                  parent: "InputParameterMap"=None, description: str=None,
                  read_only: bool=False,
-                 min_si:float=-math.inf, max_si:float=math.inf,
+                 min_si:float=_NEG_INF, max_si:float=_POS_INF,
                  format_str:str="%.2f"):
         """
         Create a new InputParameterQuantity that can contain an Quantity input
@@ -1304,15 +1786,15 @@ class InputParameterQuantity(InputParameter):
             when the default value, converted to SI units or base units, is 
             not between min_si and max_si (inclusive)
         """
-        super().__init__(key, name, default_value, display_priority,
-                         parent=parent, description=description,
-                         read_only=read_only)
-        if not isinstance(default_value, Quantity):
-            raise TypeError(f"default value {default_value} is not a Quantity")
-        if not isinstance(min_si, (int, float)):
-            raise TypeError(f"min si value {min_si} is not an int or float")
-        if not isinstance(max_si, (int, float)):
-            raise TypeError(f"max si value {max_si} is not an int or float")
+        if not self._is_value_type(default_value):
+            raise TypeError(f"default value {default_value} " + \
+                            f"is not a Quantity")
+        if not _is_number_type(type(min_si)):
+            raise TypeError(f"min si value {min_si} " + \
+                            f"is not an int or float")
+        if not _is_number_type(type(max_si)):
+            raise TypeError(f"max si value {max_si} " + \
+                            f"is not an int or float")
         if not isinstance(format_str, str):
             raise TypeError(f"format string {format_str} is not a str")
         if min_si >= max_si:
@@ -1320,14 +1802,17 @@ class InputParameterQuantity(InputParameter):
         if not min_si <= default_value.si <= max_si:
             raise ValueError(f"default value {default_value.si} not between " + \
                              f"{min_si} and {max_si}")
-        self._min_si: float = min_si
-        self._max_si: float = max_si
-        self._format: str = format_str
+        # store the bounds as plain floats for C-level float comparisons
+        self._bounds: Tuple[float, float] = _make_bounds(float(min_si),
+                                                         float(max_si))
+        if format_str != self._DEFAULT_FORMAT:
+            self._format: str = sys.intern(format_str)
         self._type: Type[Quantity] = type(default_value)
+        super().__init__(key, name, default_value, display_priority,
+                         parent=parent, description=description,
+                         read_only=read_only)
 
-    @property    
-    def value(self) -> Quantity:
-        """
+    value = property(attrgetter('_value'), doc="""
         Returns the actual value of the parameter. The value is initialized
         with default_value and is updated based on user input or data input.
         
@@ -1335,8 +1820,7 @@ class InputParameterQuantity(InputParameter):
         -------
         Quantity
             The actual value of the parameter.
-        """
-        return self._value
+        """)
 
     @property
     def min_si(self) -> float:
@@ -1349,7 +1833,7 @@ class InputParameterQuantity(InputParameter):
         float
             The minimum allowed value of the parameter in the SI or base unit.
         """
-        return self._min_si
+        return self._bounds[0]
     
     @property
     def max_si(self) -> float:
@@ -1362,7 +1846,7 @@ class InputParameterQuantity(InputParameter):
         float
             The maximum allowed value of the parameter in the SI or base unit.
         """
-        return self._max_si
+        return self._bounds[1]
     
     @property
     def format_str(self) -> str:
@@ -1374,7 +1858,7 @@ class InputParameterQuantity(InputParameter):
         str
             The defined format string of the parameter value.
         """
-        return self._format
+        return getattr(self, '_format', self._DEFAULT_FORMAT)
 
     @property
     def type(self) -> Type[Quantity]:
@@ -1407,17 +1891,49 @@ class InputParameterQuantity(InputParameter):
         ValueError
             if the new value is not between the min and max si/base values
         """
-        if self.read_only:
-            raise ValueError("parameter {self.key} is read only")
-        if not isinstance(value, self._type):
+        if self._read_only:
+            raise ValueError(f"parameter {self._key} is read only")
+        qtype = self._type
+        # exact type test first, isinstance only for Quantity subclasses
+        if type(value) is not qtype and not isinstance(value, qtype):
             raise ValueError(f"parameter value {value} not a " + \
-                             f"{self._type.__name__}")
-        if not self._min_si <= value.si <= self._max_si:
-            raise ValueError(f"parameter SI value {value.si} not between " + \
-                             f"{self._min_si} and {self._max_si}")
+                             f"{qtype.__name__}")
+        # Quantity is a float holding the SI value; skip the si property
+        si = float(value)
+        if not _in_range(self._bounds, si):
+            raise self._range_error(si)
         self._value = value
 
-        
+    def _range_error(self, si: float) -> ValueError:
+        """
+        Return the error for an SI value outside the bounds. Building the 
+        message here keeps the string formatting out of `set_value`.
+        """
+        lo, hi = self._bounds
+        return ValueError(f"parameter SI value {si} not between " + \
+                          f"{lo} and {hi}")
+
+    def bulk_validate(self, si_values: Iterable[float]) -> List[bool]:
+        """
+        Check a batch of candidate SI values against the bounds of the
+        parameter in one call, e.g., for the values of a scenario sweep.
+        The values are not stored, and the read-only flag is not checked.
+
+        Parameters
+        ----------
+        si_values: Iterable[float]
+            The candidate values, specified in SI units or base units.
+
+        Returns
+        -------
+        list[bool]
+            For each candidate value, whether it lies between min_si and
+            max_si (inclusive).
+        """
+        bounds = self._bounds
+        return [_in_range(bounds, float(si)) for si in si_values]
+
+
 class InputParameterSelectionList(InputParameter):
     """
     InputParameterSelectionList defines a string input parameter that has 
@@ -1431,10 +1947,20 @@ class InputParameterSelectionList(InputParameter):
     
     Attributes
     ----------
-    _options: list[str]
-        The values that can be entered for this parameter.
+    _options: tuple[str, ...]
+        The values that can be entered for this parameter, in the order of
+        the options list. The tuple cannot be changed, and the strings are 
+        interned, so hashing and comparing them is as cheap as possible.
+    _options_set: frozenset[str]
+        The same (interned) values as a frozenset for a fast membership test
+        when a new value is set.
     """
 
+    # the allowed type(s) of the value, checked in __init__ and set_value
+    _value_type = str
+
+    __slots__ = ('_options', '_options_set')
+
     def __init__(self, key: str, name: str, options: List[str],
                  default_value: str, display_priority: float, *,
                  parent: "InputParameterMap"=None, description: str=None,
@@ -1506,23 +2032,22 @@ class InputParameterSelectionList(InputParameter):
         ValueError
             when default_value is not one of the options in the list
         """
-        super().__init__(key, name, default_value, display_priority,
-                         parent=parent, description=description,
-                         read_only=read_only)
         if not isinstance(options, list):
             raise TypeError(f"options {options} is not a list")
-        if not all([isinstance(x, str) for x in options]):
+        if not all(isinstance(x, str) for x in options):
             raise TypeError(f"non-str element(s) in options {options}")
-        if not isinstance(default_value, str):
+        if not self._is_value_type(default_value):
             raise TypeError(f"default value {default_value} not a str")
-        if not default_value in options:
+        self._options: Tuple[str, ...] = tuple(sys.intern(x) for x in options)
+        self._options_set: frozenset = frozenset(self._options)
+        if not default_value in self._options_set:
             raise ValueError(f"default value {default_value} not in options " \
                              +f"list {options}")
-        self._options = options
+        super().__init__(key, name, default_value, display_priority,
+                         parent=parent, description=description,
+                         read_only=read_only)
 
-    @property    
-    def value(self) -> str:
-        """
+    value = property(attrgetter('_value'), doc="""
         Returns the actual value of the parameter. The value is initialized
         with default_value and is updated based on user input or data input.
         
@@ -1530,20 +2055,20 @@ class InputParameterSelectionList(InputParameter):
         -------
         str
             The actual value of the parameter, one of the elements of the list.
-        """
-        return self._value
+        """)
 
     @property    
-    def options(self) -> str:
+    def options(self) -> List[str]:
         """
-        Returns the list of allowed values for the parameter.
+        Returns the list of allowed values for the parameter. The list is a
+        copy, so changing it does not change the allowed values.
         
         Returns
         -------
         list[str]
             The list with allowed values for the parameter.
         """
-        return self._options
+        return list(self._options)
 
     def set_value(self, value: str):
         """
@@ -1563,14 +2088,15 @@ class InputParameterSelectionList(InputParameter):
         ValueError
             if the new value is not defined in the options list
         """
-        if self.read_only:
-            raise ValueError("parameter {self.key} is read only")
-        if not isinstance(value, str):
+        if self._read_only:
+            raise ValueError(f"parameter {self._key} is read only")
+        if not self._is_value_type(value):
             raise TypeError(f"parameter value {value} not a string")
-        if not value in self._options:
+        if not value in self._options_set:
             raise ValueError(f"value {value} is not a valid option " \
-                             +f"from {self._options}")
-        self._value = value
+                             +f"from {list(self._options)}")
+        # store the interned option string instead of a (GUI) copy of it
+        self._value = sys.intern(value) if type(value) is str else value
 
 
 class InputParameterUnit(InputParameterSelectionList):
@@ -1582,9 +2108,16 @@ class InputParameterUnit(InputParameterSelectionList):
     
     The `InputParameterUnit` has all attributes of the 
     `InputParameterSelectionList`. The `_value` attribute is of the 
-    type `str`.
+    type `str`. It also has the following extra attribute:
+    
+    Attributes
+    ----------
+    _type: type[Quantity]
+        The quantity type for which the units can be selected.
     """
 
+    __slots__ = ('_type',)
+
     def __init__(self, key: str, name: str, quantity: Type[Quantity],
                  default_value: str, display_priority: float, *,
                  parent: "InputParameterMap"=None, description: str=None,
@@ -1656,12 +2189,13 @@ class InputParameterUnit(InputParameterSelectionList):
         ValueError
             when default_value is not one of the units of the provided quantity
         """
-        if not issubclass(quantity, Quantity):
+        # duck-typed check on the units dict instead of an MRO walk
+        if not hasattr(quantity, '_units'):
             raise TypeError(f"quantity type {quantity} is not a Quantity")
         if not default_value in quantity._units:
             raise ValueError(f"default value {default_value} is not a unit " \
                              +f"for quantity {quantity}")
-        super().__init__(key, name, list(quantity._units.keys()),
+        super().__init__(key, name, _unit_names(quantity),
                          default_value, display_priority, parent=parent,
                          description=description, read_only=read_only)
         self._type: Type[Quantity] = quantity
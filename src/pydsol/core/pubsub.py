@@ -25,11 +25,18 @@ method.
 Note that Events are completely different from SimEvents. Events are used
 in publish/subscribe; SimEvents contain information about code to be 
 executed at a later point in time.
+
+The type checks on the arguments of the fire methods are only carried out 
+when Python runs without the -O flag, since they are executed for every 
+fired event. The checks in the Event constructors and the listener methods,
+and the checks of the event content against the metadata of the EventType,
+are always carried out.
 """
 
 from abc import ABC, abstractmethod
-import inspect
-from typing import Type, Optional, Any, Union, Set, Dict
+import logging
+import sys
+from typing import Type, Optional, Any, Union, Set, Dict, Callable, Iterable
 from pydsol.core.utils import get_module_logger
 
 __all__ = [
@@ -38,6 +45,7 @@ __all__ = [
     "Event",
     "TimedEvent",
     "EventListener",
+    "EventHandlerListener",
     "EventProducer",
     ]
 
@@ -49,6 +57,36 @@ class EventError(Exception):
     pass
 
 
+def _make_content_check(metadata: Dict[str, Type]):
+    """
+    Return a function that checks the content of an event against the 
+    metadata of its EventType. The function is made once per EventType, 
+    so the metadata pairs do not have to be looked up for every event.
+    """
+    items = tuple(metadata.items())
+    length = len(items)
+    
+    def check_content(content, check: bool):
+        if not isinstance(content, dict):
+            raise EventError("event_type defined metadata but content "
+                +"is not specified as a dict")
+        if check:
+            if len(content) != length:
+                raise EventError("metadata length not consistent with "
+                    +"content length")
+            for key, value_type in items:
+                value = content.get(key)
+                if value is None:
+                    raise EventError(f"metadata required key '{key}' not "
+                        +"found in content dict")
+                if not isinstance(value, value_type):
+                    raise EventError(f"metadata required key '{key}' to "
+                        +f"be of type {value_type.__name__} "
+                        +f"but instead got {value}")
+    
+    return check_content
+
+
 class EventType:
     """
     EventType is a strongly typed identifier for an event, which can contain
@@ -76,8 +114,11 @@ class EventType:
     """
     
     # set of the defined types to check for name clashes
-    # each item in the set has the form class_name.event_type_name
+    # each item in the set has the (interned) form class_name.event_type_name
     __defined_types: Set[str] = set()
+    
+    __slots__ = ('_defining_class', '_name', '_metadata', '_check_content')
+    
     def __init__(self, name: str, metadata: Dict[str, Type]=None):
         """
         Instantiate a new EventType, usually in a static manner. 
@@ -115,20 +156,24 @@ class EventType:
             
         """
         if not isinstance(name, str):
-            raise EventError("name {name} is not a str")
-        self._defining_class: str = inspect.stack()[1][0].f_code.co_name
+            raise EventError(f"name {name} is not a str")
+        # only the calling frame is needed; inspect.stack() would build the
+        # complete stack including the source context of every frame
+        self._defining_class: str = sys._getframe(1).f_code.co_name
         self._name = name
-        key = self._defining_class + "." + self._name;
+        key = sys.intern(self._defining_class + "." + self._name)
         if key in EventType.__defined_types:
             raise EventError(f"EventType {name} already defined")
         EventType.__defined_types.add(key)
         if metadata is not None:
             for key in metadata.keys():
                 if not isinstance(key, str):
-                    raise EventError("metadata {metadata} key not a str")
+                    raise EventError(f"metadata {metadata} key not a str")
                 if not isinstance(metadata[key], type):
-                    raise EventError("metadata {metadata} value not a type")
+                    raise EventError(f"metadata {metadata} value not a type")
         self._metadata = metadata
+        self._check_content = None if metadata is None \
+            else _make_content_check(metadata)
     
     @property
     def name(self):
@@ -158,7 +203,7 @@ class EventType:
     
     def __repr__(self):
         return f"EventType[{self._defining_class}.{self._name} " \
-            +"metadata={self._metadata}]"
+            +f"metadata={self._metadata}]"
     
 
 class Event:
@@ -167,6 +212,8 @@ class Event:
     a producer and zero or more listeners. In a sense, the Event is the
     "envelope" of the content. 
     """
+    
+    __slots__ = ('_event_type', '_content')
 
     def __init__(self, event_type: EventType, content, check:bool=True):
         """
@@ -199,23 +246,20 @@ class Event:
             raise EventError("event_type is not an instance of EventType")
         self._event_type = event_type
         self._content = content
-        if event_type.metadata is not None:
-            if not isinstance(content, dict):
-                raise EventError("event_type defined metadata but content "
-                    +"is not specified as a dict")
-            if check:
-                if len(event_type.metadata) != len(content):
-                    raise EventError("metadata length but consistent with "
-                        +"content length")
-                for key in event_type.metadata.keys():
-                    if dict(content).get(key, None) == None:
-                        raise EventError("metadata requited key '{key}' not "
-                        +"found in content dict")
-                    if not isinstance(dict(content).get(key),
-                                      event_type.metadata.get(key)):
-                        raise EventError("metadata requited key '{key}' to "
-                        +"be of type {event_type.metadata.get(key).__name__}" 
-                        +"but instead got {dict(content).get(key)}")
+        if event_type._check_content is not None:
+            event_type._check_content(content, check)
+    
+    @classmethod
+    def _create(cls, event_type: EventType, content) -> "Event":
+        """
+        Create a new Event without checking the arguments. This is meant for
+        the fire methods of the EventProducer, which have already checked 
+        the event_type and the content against the metadata.
+        """
+        event = cls.__new__(cls)
+        event._event_type = event_type
+        event._content = content
+        return event
     
     @property
     def event_type(self) -> EventType:
@@ -227,21 +271,18 @@ class Event:
         """Returns the payload of the event; can be of any type."""
         return self._content
     
-    def __str__(self):
-        c = ""
+    def _content_str(self) -> str:
+        """Return the content as a string, also when str() fails on it"""
         try:
-            c = str(self._content)
+            return str(self._content)
         except:
-            c = f"[cannot print {type(self._content).__name__}"
-        return f"Event[{self._event_type.name}: {c}]"
+            return f"[cannot print {type(self._content).__name__}]"
+    
+    def __str__(self):
+        return f"Event[{self._event_type.name}: {self._content_str()}]"
     
     def __repr__(self):
-        c = ""
-        try:
-            c = str(self._content)
-        except:
-            c = f"[cannot print {type(self._content).__name__}"
-        return f"Event[{self._event_type.name}: {c}]"
+        return self.__str__()
 
 
 class TimedEvent(Event):
@@ -255,6 +296,8 @@ class TimedEvent(Event):
     a producer and zero or more listeners. In a sense, the TimedEvent is the
     timestamped "envelope" of the content. 
     """
+    
+    __slots__ = ('_timestamp',)
 
     def __init__(self, timestamp: Union[float, int], event_type: EventType,
                  content, check:bool=True):
@@ -296,26 +339,26 @@ class TimedEvent(Event):
         self._timestamp = timestamp
         super().__init__(event_type, content, check)
     
+    @classmethod
+    def _create(cls, timestamp: Union[float, int], event_type: EventType,
+                content) -> "TimedEvent":
+        """
+        Create a new TimedEvent without checking the arguments. This is 
+        meant for the fire methods of the EventProducer, which have already
+        checked the timestamp, the event_type and the content.
+        """
+        timed_event = super()._create(event_type, content)
+        timed_event._timestamp = timestamp
+        return timed_event
+    
     @property
     def timestamp(self) -> Union[int, float]:
         """Returns the timestamp of the event; typically the simulator time."""
         return self._timestamp
     
     def __str__(self):
-        c = ""
-        try:
-            c = str(self._content)
-        except:
-            c = f"[cannot print {type(self._content).__name__}"
-        return f"TimedEvent[t={self.timestamp}, {self._event_type.name}: {c}]"
-    
-    def __repr__(self):
-        c = ""
-        try:
-            c = str(self._content)
-        except:
-            c = f"[cannot print {type(self._content).__name__}"
-        return f"TimedEvent[t={self.timestamp}, {self._event_type.name}: {c}]"
+        return f"TimedEvent[t={self._timestamp}, {self._event_type.name}: " \
+            +f"{self._content_str()}]"
 
 
 class EventListener(ABC):
@@ -337,6 +380,38 @@ class EventListener(ABC):
         """Handle an event received from an EventProducer"""
 
 
+class EventHandlerListener(EventListener):
+    """
+    The EventHandlerListener is an EventListener that dispatches an event to
+    a handler for its EventType with one dict lookup, instead of testing the
+    EventType in a chain of if-elif statements in notify(). 
+    
+    Subclasses register their handlers in the ``_handlers`` dict, usually in
+    the constructor. Events for which no handler is registered are ignored.
+    
+    Example
+    -------
+        .. code-block:: python
+        
+           class Consumer(EventHandlerListener):
+               def __init__(self):
+                   self._handlers = {Producer.PRODUCTION_EVENT: self.produced}
+               
+               def produced(self, event: Event):
+                   ...
+    """
+    
+    # the default is an empty dict that is shared; assign a new dict in the
+    # subclass or instance rather than adding handlers to this one
+    _handlers: Dict[EventType, Callable[[Event], Any]] = {}
+    
+    def notify(self, event: Event):
+        """Call the handler for the EventType of the event, if any"""
+        handler = self._handlers.get(event.event_type)
+        if handler is not None:
+            handler(event)
+
+
 class EventProducer:
     """
     EventProducer is an abstract class defining the producer behavior.
@@ -356,12 +431,35 @@ class EventProducer:
     the model run. The dictionary is ordered (unsorted) in Python 3.7+, 
     and the list is reproducible. A ``dict[EventType, set[EventListener]]`` 
     would not be reproducible, since the set is unordered.   
+    
+    The lists of listeners are copy-on-write: adding or removing a listener
+    replaces the list for the EventType by a new list, and a list is never
+    changed in place. Firing an event can therefore loop over the list 
+    without copying it, even when a listener unsubscribes in its notify().
+    
+    Next to the listeners, ``_notifiers: dict[EventType, tuple[Callable]]``
+    holds the bound notify() methods of the listeners in the same order, so 
+    firing does not look up the notify method of each listener again. The
+    bound methods are taken when a listener subscribes; a notify method 
+    that is replaced on the listener object afterwards is not used.
     """
 
     def __init__(self):
         """Instantiate the EventProducer, and initialize the empty 
         listener data structure"""
         self._listeners: dict[EventType, list[EventListener]] = dict()
+        self._notifiers: dict[EventType, tuple] = dict()
+    
+    def _set_listeners(self, event_type: EventType, 
+                       listeners: list[EventListener]):
+        """Store a new list of listeners for the event_type, together with
+        their bound notify methods, or remove both when the list is empty"""
+        if listeners:
+            self._listeners[event_type] = listeners
+            self._notifiers[event_type] = tuple(l.notify for l in listeners)
+        else:
+            self._listeners.pop(event_type, None)
+            self._notifiers.pop(event_type, None)
         
     def add_listener(self, event_type: EventType, listener: EventListener):
         """
@@ -385,10 +483,11 @@ class EventProducer:
             raise EventError("event_type should be an EventType")
         if not isinstance(listener, EventListener):
             raise EventError("listener should be an EventListener")
-        if event_type not in self._listeners:
-            self._listeners[event_type] = []
-        if listener not in self._listeners[event_type]:
-            self._listeners[event_type].append(listener)
+        listeners = self._listeners.get(event_type)
+        if listeners is None:
+            self._set_listeners(event_type, [listener])
+        elif listener not in listeners:
+            self._set_listeners(event_type, listeners + [listener])
     
     def remove_listener(self, event_type: EventType, listener: EventListener):
         """
@@ -412,11 +511,11 @@ class EventProducer:
             raise EventError("event_type should be an EventType")
         if not isinstance(listener, EventListener):
             raise EventError("listener should be an EventListener")
-        if event_type in self._listeners:
-            if listener in self._listeners[event_type]:
-                self._listeners[event_type].remove(listener)
-                if len(list(self._listeners[event_type])) == 0:
-                    del self._listeners[event_type]
+        listeners = self._listeners.get(event_type)
+        if listeners is not None and listener in listeners:
+            listeners = listeners.copy()
+            listeners.remove(listener)
+            self._set_listeners(event_type, listeners)
     
     def remove_all_listeners(self, event_type:EventType=None,
                         listener:EventListener=None):
@@ -454,20 +553,24 @@ class EventProducer:
         if event_type == None:
             if listener == None:
                 self._listeners.clear()
+                self._notifiers.clear()
             else:
                 # a list() is used to avoid concurrent modification error
                 for et in list(self._listeners.keys()):
                     self.remove_listener(et, listener)
         else:
             if listener == None:
-                if event_type in self._listeners:
-                    del self._listeners[event_type]
+                self._set_listeners(event_type, [])
             else:
                 self.remove_listener(event_type, listener)
     
-    def has_listeners(self) -> bool:
-        """indicate whether this producer has any listeners or not"""
-        return len(self._listeners) > 0
+    def has_listeners(self, event_type: EventType=None) -> bool:
+        """indicate whether this producer has any listeners or not; when
+        an event_type is given, only the listeners for that event type 
+        are taken into account"""
+        if event_type is None:
+            return len(self._listeners) > 0
+        return event_type in self._notifiers
     
     def fire_event(self, event: Event):
         """
@@ -484,16 +587,20 @@ class EventProducer:
         EventError
             if the event is not of the right type
         """
-        if not isinstance(event, Event):
-            raise EventError("event {event} not of type Event")
-        logger.debug("fire %s to %s", event,
-                     self._listeners.get(event.event_type))
-        if event.event_type not in self._listeners:
+        if __debug__:
+            if not isinstance(event, Event):
+                raise EventError(f"event {event} not of type Event")
+        # one dict lookup, and an early return when nobody listens
+        notifiers = self._notifiers.get(event.event_type)
+        if notifiers is None:
             return
-        # a copy() is used to avoid concurrent modification error in case 
-        # the notification would unsubscribe a listener to this event (!)
-        for listener in self._listeners.get(event.event_type).copy():
-            listener.notify(event)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("fire %s to %s", event, 
+                         self._listeners.get(event.event_type))
+        # the tuple is replaced when a listener unsubscribes during the
+        # notification, so it does not change while it is iterated
+        for notify in notifiers:
+            notify(event)
  
     def fire(self, event_type: EventType, content, check: bool=True):
         """
@@ -521,8 +628,22 @@ class EventProducer:
         EventError
             if the dict content is not consistent with the EventType metadata
         """
-        event = Event(event_type, content, check)
-        self.fire_event(event)
+        if __debug__:
+            if not isinstance(event_type, EventType):
+                raise EventError("event_type is not an instance of EventType")
+        if event_type._check_content is not None:
+            event_type._check_content(content, check)
+        notifiers = self._notifiers.get(event_type)
+        if notifiers is None:
+            # nobody listens: the arguments are checked, but no Event is made
+            return
+        # the arguments have been checked, so skip Event.__init__
+        event = Event._create(event_type, content)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("fire %s to %s", event, 
+                         self._listeners.get(event_type))
+        for notify in notifiers:
+            notify(event)
     
     def fire_timed_event(self, timed_event: TimedEvent):
         """
@@ -539,16 +660,19 @@ class EventProducer:
         EventError
             if the timed_event is not of the right type
         """
-        if not isinstance(timed_event, TimedEvent):
-            raise EventError("event {event} not of type TimedEvent")
-        logger.debug("fire %s to %s", timed_event,
-                     self._listeners.get(timed_event.event_type))
-        if timed_event.event_type not in self._listeners:
+        if __debug__:
+            if not isinstance(timed_event, TimedEvent):
+                raise EventError(f"event {timed_event} not of type TimedEvent")
+        notifiers = self._notifiers.get(timed_event.event_type)
+        if notifiers is None:
             return
-        # a copy() is used to avoid concurrent modification error in case 
-        # the notification would unsubscribe a listener to this event (!)
-        for listener in self._listeners.get(timed_event.event_type).copy():
-            listener.notify(timed_event)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("fire %s to %s", timed_event, 
+                         self._listeners.get(timed_event.event_type))
+        # the tuple is replaced when a listener unsubscribes during the
+        # notification, so it does not change while it is iterated
+        for notify in notifiers:
+            notify(timed_event)
 
     def fire_timed(self, time: Union[int, float], event_type: EventType,
                    content, check: bool=True):
@@ -581,5 +705,93 @@ class EventProducer:
         EventError
             if the dict content is not consistent with the EventType metadata
         """
-        timed_event = TimedEvent(time, event_type, content, check)
-        self.fire_timed_event(timed_event)
+        if __debug__:
+            if not isinstance(event_type, EventType):
+                raise EventError("event_type is not an instance of EventType")
+            if not isinstance(time, (int, float)):
+                raise EventError("timestamp is not an int or a float")
+        if event_type._check_content is not None:
+            event_type._check_content(content, check)
+        notifiers = self._notifiers.get(event_type)
+        if notifiers is None:
+            # nobody listens: the arguments are checked, but no Event is made
+            return
+        # the arguments have been checked, so skip TimedEvent.__init__
+        timed_event = TimedEvent._create(time, event_type, content)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("fire %s to %s", timed_event, 
+                         self._listeners.get(event_type))
+        for notify in notifiers:
+            notify(timed_event)
+
+    def fire_batch(self, event_type: EventType, contents: Iterable, 
+                   timestamps: Optional[Iterable[Union[int, float]]]=None, 
+                   check: bool=True):
+        """
+        construct an event for each of the contents and fire these events in
+        order to the subscribed listeners for the event_type. When timestamps
+        are given, timed events are fired. The arguments are checked before
+        the first event is fired, and the listeners for the event_type are 
+        looked up once for the whole batch, so listeners that subscribe or
+        unsubscribe during the batch only take effect for the next fire.
+        
+        Parameters
+        ----------
+        event_type : EventType
+            a reference to a (usually static) event type for identification
+        contents : Iterable
+            the payloads of the events, one event per payload
+        timestamps : Iterable[int or float], optional
+            the timestamps of the events, in the same order as the contents;
+            when None, events without a timestamp are fired
+        check : bool, optional
+            whether to check the fields in the content in case the 
+            event_type has metadata; the check whether the content is a
+            dict is always checked when there is metadata 
+            
+        Raises
+        ------
+        EventError
+            if event_type is not an EventType
+        EventError
+            if the number of timestamps differs from the number of contents
+        EventError
+            if a timestamp is not of type int or float
+        EventError
+            if the EventType specified metadata and a content is not a dict
+        EventError
+            if a dict content is not consistent with the EventType metadata
+        """
+        if __debug__:
+            if not isinstance(event_type, EventType):
+                raise EventError("event_type is not an instance of EventType")
+        contents = list(contents)
+        if timestamps is not None:
+            timestamps = list(timestamps)
+            if len(timestamps) != len(contents):
+                raise EventError(f"{len(timestamps)} timestamps given for "
+                                 + f"{len(contents)} contents")
+            if __debug__:
+                for time in timestamps:
+                    if not isinstance(time, (int, float)):
+                        raise EventError("timestamp is not an int or a float")
+        check_content = event_type._check_content
+        if check_content is not None:
+            for content in contents:
+                check_content(content, check)
+        notifiers = self._notifiers.get(event_type)
+        if notifiers is None:
+            return
+        # the arguments have been checked, so skip the event constructors
+        if timestamps is None:
+            create = Event._create
+            for content in contents:
+                event = create(event_type, content)
+                for notify in notifiers:
+                    notify(event)
+        else:
+            create = TimedEvent._create
+            for time, content in zip(timestamps, contents):
+                event = create(time, event_type, content)
+                for notify in notifiers:
+                    notify(event)
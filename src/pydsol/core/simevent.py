@@ -11,6 +11,7 @@ SimEvent, which will be recognized by the event lists and other classes.
 
 from abc import ABC, abstractmethod
 from inspect import isfunction, ismethod
+import itertools
 from typing import Union
 
 from pydsol.core.utils import DSOLError, get_module_logger
@@ -31,6 +32,8 @@ class SimEventInterface(ABC):
     executable, so it defines the execute() method.
     """
     
+    __slots__ = ()
+    
     # static priorities that can be used, based on Java thread priorities
     MIN_PRIORITY: int = 1
     NORMAL_PRIORITY: int = 5
@@ -80,21 +83,23 @@ class SimEvent(SimEventInterface):
         the object on which the method has to be called
     _method : method
         the method to call, stored as the attr of the target
+    _args : tuple
+        a tuple with positional arguments to use for the method
     _kwargs : dict
-        a dict with arguments to use for the method
+        a dict with keyword arguments to use for the method
     """
     
-    # Internal static event counter to allocate the unique id to a SimEvent
-    __event_counter: int = 0
+    # many SimEvents are created and discarded during a simulation run, 
+    # so the instances do not carry a __dict__
+    __slots__ = ('_absolute_time', '_priority', '_id', '_target', '_args',
+                 '_kwargs', '_method')
     
-    # Increment and return the static event counter
-    @classmethod
-    def __new_event_counter(cls) -> int:
-        cls.__event_counter += 1
-        return cls.__event_counter
+    # Internal static event counter to allocate the unique id to a SimEvent
+    __event_counter = itertools.count(1)
     
     def __init__(self, time: Union[int, float], target, method: str,
-                 priority: int=SimEventInterface.NORMAL_PRIORITY, **kwargs):
+                 priority: int=SimEventInterface.NORMAL_PRIORITY, 
+                 *args, **kwargs):
         """
         Parameters
         ----------
@@ -109,6 +114,9 @@ class SimEvent(SimEventInterface):
             same time. Higher numbers indicate higher priority. Typically,
             priorities are numbered 1 through 10 with a default priority of 5.
             When not provided, the default priority of 5 will be used.
+        *args: tuple (optional)
+            positional arguments of the method call; when they are used, 
+            the priority has to be provided as a positional argument too
         **kwargs: dict (optional)
             the arguments of the method call provided as comma-separated
             arg=value pairs
@@ -121,8 +129,9 @@ class SimEvent(SimEventInterface):
         """
         self._absolute_time: Union[int, float] = time
         self._priority: int = priority
-        self._id: int = SimEvent.__new_event_counter()
+        self._id: int = next(SimEvent.__event_counter)
         self._target = target
+        self._args = args
         self._kwargs = kwargs
         
         if not isinstance(method, str):
@@ -135,7 +144,7 @@ class SimEvent(SimEventInterface):
 
         if not isfunction(self._method) and not ismethod(self._method):
             raise DSOLError("method should be a valid method name")
-        if not isinstance(time, float) and not isinstance(time, int):
+        if not isinstance(time, (float, int)):
             raise DSOLError("time should be float or int")
         if not isinstance(priority, int):
             raise DSOLError("priority should be int")
@@ -156,10 +165,11 @@ class SimEvent(SimEventInterface):
         DSOLError: when the method call fails or returns an exception
         """
         try:
-            self._method(**self._kwargs)
+            self._method(*self._args, **self._kwargs)
         except:
             raise(DSOLError(f"method {self._method}(..) is not callable " \
-                +f"on {self._target} with arguments {self._kwargs}"))
+                +f"on {self._target} with arguments {self._args} " \
+                +f"and {self._kwargs}"))
 
     def __cmp__(self, other: SimEventInterface) -> int:
         """
@@ -241,6 +251,11 @@ class SimEvent(SimEventInterface):
         """Return the name of the method to be called on the target."""
         return self._method.__name__
     
+    @property
+    def args(self) -> tuple: 
+        """Return the tuple of positional arguments for the method."""
+        return self._args
+    
     @property
     def kwargs(self) -> dict: 
         """Return the dict of arguments to be passed to the method."""
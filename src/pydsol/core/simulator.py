@@ -1,6 +1,10 @@
 """
 The simulator module defines different simulators that can be used to
 advance time in a simulation and change the state of the model over time. 
+
+The check that every event taken from the event list is a 
+SimEventInterface is only carried out when Python runs without the -O 
+flag, since it is executed for every event in the simulation loop.
 """
 
 from abc import abstractmethod
@@ -8,7 +12,7 @@ import enum
 import logging
 import sys
 from threading import Thread
-import threading
+import _thread
 from time import sleep
 import time
 import traceback
@@ -41,9 +45,12 @@ logger = get_module_logger('simulator')
 TIME = TypeVar("TIME", float, int)
 
 
-class RunState(enum.Enum):
+class RunState(enum.IntEnum):
     """
-    RunState indicates the precise state of the Simulator.
+    RunState indicates the precise state of the Simulator. The states are
+    numbered in the order in which they occur, so the states that belong 
+    together form a range of values; e.g., a running simulator has a run 
+    state between STARTING and STARTED.
     """
     
     NOT_INITIALIZED = 1
@@ -73,7 +80,7 @@ class RunState(enum.Enum):
     """The replication has ended, and the simulator cannot be restarted"""
 
 
-class ReplicationState(enum.Enum):
+class ReplicationState(enum.IntEnum):
     """
     ReplicationState indicates the precise state of the replication that is
     being executed by the simulator.
@@ -164,15 +171,26 @@ class SimulatorWorkerThread(Thread):
     activities while the simulation is running. In an interactive setting, a
     user can hereby stop() the simulator and inspect the state of the 
     simulation model, and continue the simulation by calling start().
+    
+    When the simulator runs inline, the job is executed in the thread that
+    calls start(), and the worker thread keeps waiting. The worker of an
+    inline simulator is a daemon thread, so a waiting worker does not keep
+    the program alive. Otherwise, the worker keeps the program alive until
+    the run has finished, also when the thread that started the run has
+    already returned.
     """
 
     def __init__(self, name: str, job: 'Simulator'):
         super().__init__(name=name)
         self._job: 'Simulator' = job
-        self.daemon = False
+        self.daemon = job._inline
         self._running: bool = False
         self._finalized: bool = False
-        self.__wakeup_flag = threading.Event()
+        self._waiting: bool = False
+        # a raw lock acts as a binary semaphore for the wakeup: it is held 
+        # while the worker sleeps, and released to wake the worker up
+        self.__wakeup_lock = _thread.allocate_lock()
+        self.__wakeup_lock.acquire()
         self.start()
     
     def cleanup(self):
@@ -184,10 +202,13 @@ class SimulatorWorkerThread(Thread):
         return self._running
     
     def wakeup(self):
-        self.__wakeup_flag.set()
+        try:
+            self.__wakeup_lock.release()
+        except RuntimeError:
+            pass  # a wakeup is already pending
         
     def is_waiting(self):
-        return len(self.__wakeup_flag._cond._waiters) > 0
+        return self._waiting
 
     def is_finalized(self):
         return self._finalized
@@ -195,33 +216,45 @@ class SimulatorWorkerThread(Thread):
     def run(self):
         while not self._finalized:
             # wait till wakeup, e.g., to start the simulation
-            self.__wakeup_flag.wait()
+            self._waiting = True
+            self.__wakeup_lock.acquire()
+            self._waiting = False
             self._running = True
             if not self._finalized:
-                if self._job._replication_state != ReplicationState.ENDING:
-                    try:
-                        self._job.fire_timed(self._job.simulator_time,
-                            Simulator.START_EVENT, None)
-                        self._job._run_state = RunState.STARTED
-                        self._job._run()
-                        self._job.fire_timed(self._job.simulator_time,
-                            Simulator.STOP_EVENT, None)
-                        self._job._run_state = RunState.STOPPED
-                    except Exception as e:
-                        print("Simulator run interrupted by exception:")
-                        print(str(e))
-                        traceback.print_exc()
-                if self._job._replication_state == ReplicationState.ENDING:
-                    self._job._replication_state = ReplicationState.ENDED
-                    self._job._run_state = RunState.ENDED
-                    self._job.fire_timed(self._job.simulator_time,
-                        ReplicationInterface.END_REPLICATION_EVENT, None)
-                    self._finalized = True
-            self.__wakeup_flag.clear()
+                self.execute()
+            # discard a wakeup that arrived during the execution
+            self.__wakeup_lock.acquire(blocking=False)
             self._running = False
         # end while
     # end run()
 
+    def execute(self):
+        """Run the simulator job until it stops, and end the replication 
+        when the job indicates that the replication is ending. This method
+        is called by run() in the worker thread, or directly in the calling
+        thread when the simulator runs inline."""
+        job = self._job
+        if job._replication_state != ReplicationState.ENDING:
+            try:
+                job.fire_timed(job.simulator_time, Simulator.START_EVENT,
+                               None)
+                job._run_state = RunState.STARTED
+                job._run()
+                job.fire_timed(job.simulator_time, Simulator.STOP_EVENT,
+                               None)
+                job._run_state = RunState.STOPPED
+            except Exception as e:
+                print("Simulator run interrupted by exception:")
+                print(str(e))
+                traceback.print_exc()
+        if job._replication_state == ReplicationState.ENDING:
+            job._replication_state = ReplicationState.ENDED
+            job._run_state = RunState.ENDED
+            job.fire_timed(job.simulator_time,
+                ReplicationInterface.END_REPLICATION_EVENT, None)
+            self._finalized = True
+            self.wakeup()  # let a waiting worker thread end
+
 
 class Simulator(EventProducer, SimulatorInterface, Generic[TIME]):
     """
@@ -253,6 +286,7 @@ class Simulator(EventProducer, SimulatorInterface, Generic[TIME]):
         self._error_strategy = ErrorStrategy.WARN_AND_PAUSE
         self._error_log_level = logging.ERROR
         self._runflag: bool = False
+        self._inline: bool = False
         
     @property
     def name(self) -> str:
@@ -358,12 +392,16 @@ class Simulator(EventProducer, SimulatorInterface, Generic[TIME]):
                 ReplicationInterface.START_REPLICATION_EVENT, None)
             self._replication_state = ReplicationState.STARTED
         self.fire(Simulator.STARTING_EVENT, None)
-        # wake up the run() method of the worker thread to start Simulator.run
-        self.__worker.wakeup()
-        # wait maximally one second
-        msec: int = int(time.time() * 1000)
-        while not self._runflag and int(time.time() * 1000) - msec < 1000:
-            sleep(0.001)
+        if self._inline:
+            # run in the calling thread; returns when the simulator stopped
+            self.__worker.execute()
+        else:
+            # wake up the run() method of the worker thread to start run()
+            self.__worker.wakeup()
+            # wait maximally one second
+            msec: int = int(time.time() * 1000)
+            while not self._runflag and int(time.time() * 1000) - msec < 1000:
+                sleep(0.001)
         self._runflag = False
             
     def start(self):
@@ -386,8 +424,8 @@ class Simulator(EventProducer, SimulatorInterface, Generic[TIME]):
         differential equation for the next timestep. So the time is changed 
         first to match the logic carried out for that time, and then the 
         action for that time is carried out. This is INDEPENDENT of the 
-        fact whether the time changes or not. The TIME_CHANGED_EVENT is
-        always fired."""
+        fact whether the time changes or not. The TIME_CHANGED_EVENT may
+        be skipped when it has no listeners."""
      
     def step(self):
         """Steps the simulator, and fire a STEP_EVENT to indicate the 
@@ -412,7 +450,7 @@ class Simulator(EventProducer, SimulatorInterface, Generic[TIME]):
                             Simulator.START_EVENT, None)
             self._step_impl()
         except Exception as e:
-            print("Simulator step got exception: " + e)
+            print(f"Simulator step got exception: {e}", file=sys.stderr)
         finally:
             self.fire_timed(self._simulator_time,
                             Simulator.STOP_EVENT, None)
@@ -457,6 +495,28 @@ class Simulator(EventProducer, SimulatorInterface, Generic[TIME]):
         self.fire_timed(self.simulator_time,
                         ReplicationInterface.WARMUP_EVENT, None)
 
+    @property
+    def inline(self) -> bool:
+        """return whether start() and run_up_to() run the simulation in the
+        calling thread rather than in the worker thread"""
+        return self._inline
+
+    def set_inline(self, inline: bool):
+        """
+        Set whether start() and run_up_to() run the simulation in the 
+        calling thread. An inline run returns when the simulator has 
+        stopped, and avoids the thread switches to and from the worker 
+        thread. This is useful for batch runs, tests and notebooks, but 
+        a user interface thread will block until the simulator stops.
+        
+        The inline mode has to be set before initialize(), since the 
+        worker thread that initialize() creates is only a daemon thread 
+        for an inline simulator. After cleanup(), it can be set again.
+        """
+        if self.is_initialized():
+            raise DSOLError("cannot change inline mode after initialize")
+        self._inline = inline
+
     @property
     def run_state(self) -> RunState:
         """return the run state of the simulator"""
@@ -465,19 +525,18 @@ class Simulator(EventProducer, SimulatorInterface, Generic[TIME]):
     def is_initialized(self) -> bool:
         """Return whether the simulator has been initialized with a 
         replication for a model."""
-        return self.run_state != RunState.NOT_INITIALIZED
+        return self._run_state != RunState.NOT_INITIALIZED
     
     def is_starting_or_running(self) -> bool:
         """Return whether the simulator is starting or has started.""" 
-        return (self.run_state == RunState.STARTING or \
-               self.run_state == RunState.STARTED)
+        return RunState.STARTING <= self._run_state <= RunState.STARTED
     
     def is_stopping_or_stopped(self) -> bool:
         """Return whether the simulator is stopping or has been stopped. 
         This method also returns True when the simulator has not yet been
         initialized, or when the model has not yet started, or when the
         model run has ended.""" 
-        return not self.is_starting_or_running()
+        return not RunState.STARTING <= self._run_state <= RunState.STARTED
     
     @property
     def replication_state(self) -> ReplicationState:
@@ -486,10 +545,14 @@ class Simulator(EventProducer, SimulatorInterface, Generic[TIME]):
 
     def end_replication(self):
         self._replication_state = ReplicationState.ENDING
-        self.__worker.wakeup()  # just to be sure
+        if not self._inline:
+            self.__worker.wakeup()  # just to be sure
         if self._simulator_time < self._replication.end_sim_time:
             print("warning: end_replication called with simtime < runlength")
             self._simulator_time = self._replication.end_sim_time
+        if self._inline and not self.is_starting_or_running():
+            # no inline run will pick up the ending replication
+            self.__worker.execute()
     
     def set_error_strategy(self, error_strategy: ErrorStrategy,
                            log_level: int=-1):
@@ -528,9 +591,20 @@ class Simulator(EventProducer, SimulatorInterface, Generic[TIME]):
 
 class DEVSSimulator(Simulator[TIME], Generic[TIME]):
     
-    def __init__(self, name: str, time_type: type, initial_time: TIME):
+    def __init__(self, name: str, time_type: type, initial_time: TIME,
+                 eventlist: EventListInterface=None):
+        """
+        Create a discrete-event simulator. The event list to use can be
+        provided, e.g., to plug in an event list implementation that is 
+        tuned for the event time distribution of a model. When no event 
+        list is provided, an EventListHeap is used.
+        """
         super().__init__(name, time_type, initial_time)
-        self._eventlist: EventListInterface = EventListHeap()
+        if eventlist is None:
+            eventlist = EventListHeap()
+        elif not isinstance(eventlist, EventListInterface):
+            raise DSOLError(f"eventlist {eventlist} not an EventListInterface")
+        self._eventlist: EventListInterface = eventlist
     
     def initialize(self, model:ModelInterface, replication:ReplicationInterface):
         # this check HAS to be done before clearing the eventlist
@@ -580,6 +654,17 @@ class DEVSSimulator(Simulator[TIME], Generic[TIME]):
         return self.schedule_event(SimEvent(time,
                  target, method, priority, **kwargs))
 
+    def schedule_event_args(self, time, target, method: str, args: tuple=(),
+                 priority: int=SimEventInterface.NORMAL_PRIORITY
+                 ) -> SimEventInterface:
+        """schedule a method call at an absolute time, with the arguments
+        of the method call as a tuple of positional arguments rather 
+        than as keyword arguments."""
+        if time < self._simulator_time:
+            raise DSOLError("cannot schedule event in the past")
+        return self.schedule_event(SimEvent(time,
+                 target, method, priority, *args))
+
     def cancel_event(self, event: SimEventInterface):
         """remove the provided event from the event list"""
         self._eventlist.remove(event)
@@ -590,11 +675,12 @@ class DEVSSimulator(Simulator[TIME], Generic[TIME]):
         simulation event. So the time is changed first to match the logic 
         carried out for that time, and then the action for that time is 
         carried out. This is INDEPENDENT of the fact whether the time changes 
-        or not. The TIME_CHANGED_EVENT is always fired."""
+        or not. The TIME_CHANGED_EVENT is only fired when it has listeners."""
         if not self._eventlist.is_empty():
             event: SimEventInterface = self._eventlist.pop_first()
-            self.fire_timed(event.time, Simulator.TIME_CHANGED_EVENT,
-                            event.time)
+            if self.has_listeners(Simulator.TIME_CHANGED_EVENT):
+                self.fire_timed(event.time, Simulator.TIME_CHANGED_EVENT,
+                                event.time)
             self._simulator_time = event.time
             event.execute()
 
@@ -604,34 +690,49 @@ class DEVSSimulator(Simulator[TIME], Generic[TIME]):
         
     def _run(self):
         self._runflag = True
-        while not self.is_stopping_or_stopped():
-            # check if we are done
-            if self.eventlist().is_empty():
-                t = self._run_until_time
-            else:
-                t = self.eventlist().peek_first().time
-            if (t > self._run_until_time or (t == self._run_until_time \
-                    and not self._run_until_including) 
-                    or self.eventlist().is_empty()):
-                self._simulator_time = self._run_until_time
+        # bind the attributes and methods that are used for every event;
+        # the run-until settings cannot change while the simulator runs
+        pop_first = self._eventlist.pop_first
+        has_listeners = self.has_listeners
+        fire_timed = self.fire_timed
+        time_changed = Simulator.TIME_CHANGED_EVENT
+        run_until = self._run_until_time
+        including = self._run_until_including
+        starting = RunState.STARTING
+        started = RunState.STARTED
+        while self._run_state is started or self._run_state is starting:
+            # get the first event, and check if we are done; pop_first 
+            # returns None when empty, and the one event that is beyond 
+            # the run-until time is put back, saving a peek for every event
+            event: SimEventInterface = pop_first()
+            if (event is None or event.time > run_until
+                    or (event.time == run_until and not including)):
+                if event is not None:
+                    self._eventlist.add(event)
+                self._simulator_time = run_until
                 self._replication_state = ReplicationState.ENDING
                 self._run_state = RunState.STOPPING
                 return;
-            # get the first event
-            event: SimEventInterface = self.eventlist().pop_first()
-            if not isinstance(event, SimEventInterface):
-                raise DSOLError(f"Invalid SimEvent {event} from eventlist")
-            if (event.time != self.simulator_time):
-                self.fire_timed(event.time, Simulator.TIME_CHANGED_EVENT,
-                                event.time)
-            self._simulator_time = event.time
+            if __debug__:
+                if not isinstance(event, SimEventInterface):
+                    raise DSOLError(f"Invalid SimEvent {event} from eventlist")
+            event_time = event.time
+            # listeners can (un)subscribe during the run, so check each time
+            if (event_time != self._simulator_time 
+                    and has_listeners(time_changed)):
+                fire_timed(event_time, time_changed, event_time)
+            self._simulator_time = event_time
             try:
                 event.execute()
             except Exception as e:
-                s = "Exception during simulation at t={self.simulator_time}: "
-                logger.log(self._error_log_level, s + str(e))
+                # only format the message when it is logged or printed
+                if logger.isEnabledFor(self._error_log_level):
+                    logger.log(self._error_log_level, 
+                               "Exception during simulation at t=%s: %s",
+                               self._simulator_time, e)
                 if self._error_strategy > ErrorStrategy.LOG_AND_CONTINUE:
-                    print(s + str(e))
+                    print("Exception during simulation at "
+                          + f"t={self._simulator_time}: {e}", file=sys.stderr)
                     traceback.print_exc()
                 if self._error_strategy == ErrorStrategy.WARN_AND_PAUSE:
                     self._run_state = RunState.STOPPING
@@ -646,18 +747,20 @@ class DEVSSimulator(Simulator[TIME], Generic[TIME]):
                 
 class DEVSSimulatorFloat(DEVSSimulator[float]):
     
-    def __init__(self, name:str):
-        super().__init__(name, float, 0.0)
+    def __init__(self, name:str, eventlist: EventListInterface=None):
+        super().__init__(name, float, 0.0, eventlist)
 
 
 class DEVSSimulatorInt(DEVSSimulator[int]):
     
-    def __init__(self, name:str):
-        super().__init__(name, int, 0)
+    def __init__(self, name:str, eventlist: EventListInterface=None):
+        super().__init__(name, int, 0, eventlist)
 
 
 class DEVSSimulatorDuration(DEVSSimulator[Duration]):
     
-    def __init__(self, name: str, display_unit: str='s'):
-        super().__init__(name, Duration, Duration(0.0, display_unit))
+    def __init__(self, name: str, display_unit: str='s', 
+                 eventlist: EventListInterface=None):
+        super().__init__(name, Duration, Duration(0.0, display_unit), 
+                         eventlist)
         self._display_unit = display_unit
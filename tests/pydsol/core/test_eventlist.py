@@ -83,6 +83,35 @@ def test_eventlist():
     assert repr(elist) == "[]"
 
 
+def test_remove():
+    elist = EventListHeap()
+    t1 = Target()
+    events = [SimEvent(float(i % 7), t1, "empty") for i in range(20)]
+    for e in events:
+        elist.add(e)
+    # remove the front event, and enough events to trigger a rebuild
+    first = elist.peek_first()
+    assert elist.remove(first)
+    assert not elist.contains(first)
+    assert not elist.remove(first)
+    for e in events[1:12]:
+        if e is not first:
+            assert elist.remove(e)
+    removed = [first] + [e for e in events[1:12] if e is not first]
+    assert elist.size() == 20 - len(removed)
+    # a removed event can be added again
+    elist.add(events[3])
+    assert elist.contains(events[3])
+    removed.remove(events[3])
+    assert elist.size() == 20 - len(removed)
+    assert str(elist).count("(") == elist.size()
+    popped = []
+    while not elist.is_empty():
+        popped.append(elist.pop_first())
+    assert popped == sorted(e for e in events if e not in removed)
+    assert elist.peek_first() is None
+
+
 def test_interface():
     """Check that the needed methods exist"""
     EventListInterface.add(None, None)
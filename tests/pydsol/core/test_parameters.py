@@ -50,6 +50,23 @@ def test_parameter():
         r.set_value(9.0)
         
     assert list(m.value.keys()) == ["o-key", "p-key", "q-key", "r-key"]
+    u = InputParameter._create_unchecked("u-key", "u-name", 1.0, 2.5, m,
+                                         None, False)
+    assert u.extended_key() == "root.u-key"
+    assert u.description == ""
+    assert list(m.value.keys()) == ["o-key", "p-key", "u-key", "q-key",
+                                    "r-key"]
+    m.remove("u-key")
+    s = InputParameterStr._create_unchecked("s-key", "s-name", "x", 1.0,
+                                            None, None, False)
+    assert s.value == "x"
+    with pytest.raises(TypeError):
+        InputParameterMap._create_unchecked("v-key", "v-name", {}, 1.0,
+                                            None, None, False)
+    with pytest.raises(TypeError):
+        InputParameterFloat._create_unchecked("v-key", "v-name", 1.0, 1.0,
+                                              m, None, False)
+    assert "v-key" not in m.value
 
     with pytest.raises(TypeError):
         InputParameter(3, "n", 1, 1.0)
@@ -80,6 +97,12 @@ def test_parameter():
     tria.add(InputParameterFloat("b", "b", 2.0, 2.0))
     tria.add(InputParameterFloat("c", "c", 3.0, 3.0))
     assert tria.get("a").extended_key() == "root.tria.a"
+    sub: InputParameterMap = InputParameterMap("sub", "sub", 8)
+    x = InputParameterInt("x", "x", 1, 1.0, parent=sub)
+    assert x.extended_key() == "sub.x"
+    m.add(sub)
+    assert x.extended_key() == "root.sub.x"
+    m.remove("sub")
     assert m.get("tria.a") == tria.get("a") 
 
     with pytest.raises(KeyError):
@@ -93,12 +116,32 @@ def test_parameter():
     m.add(r)
     m.remove("tria.a")
     assert len(tria.value) == 2
+    tria.add(InputParameterFloat("a2", "a2", 1.0, 2.0))
+    tria.add(InputParameterFloat("a1", "a1", 1.0, 1.5))
+    assert list(tria.value.keys()) == ["a1", "b", "a2", "c"]
+    bulk: InputParameterMap = InputParameterMap("bulk", "bulk", 9, parent=m)
+    bulk.add(InputParameterInt("b2", "b2", 2, 2.0))
+    bulk.bulk_add([InputParameterInt("b3", "b3", 3, 3.0),
+                   InputParameterInt("b1", "b1", 1, 1.0)])
+    assert list(bulk.value.keys()) == ["b1", "b2", "b3"]
+    assert m.get("bulk.b1").extended_key() == "root.bulk.b1"
+    with pytest.raises(ValueError):
+        bulk.bulk_add([InputParameterInt("b4", "b4", 4, 4.0),
+                       InputParameterInt("b2", "b2", 2, 5.0)])
+    with pytest.raises(TypeError):
+        bulk.bulk_add(['x'])
+    assert len(bulk.value) == 3
+    m.remove("bulk")
     with pytest.raises(KeyError):
         m.remove("x")
     with pytest.raises(KeyError):
         m.remove("tria.d")
     with pytest.raises(KeyError):
         m.remove("x.a")
+    assert m.get("tria.b") == tria.get("b")
+    tria.remove("b")
+    with pytest.raises(KeyError):
+        m.get("tria.b")
 
     assert "c = 3.0" in m.print_values()
     assert "p-key" in m.print_values()
@@ -145,10 +188,19 @@ def test_parameter_int():
     assert q.min_value == 0
     assert q.max_value == 100
     assert q.format_str == "%3d"
+    assert q.format_value() == "%3d" % q.value
     
     r = InputParameterInt("r", "rname", 4, 1, read_only=True)
     assert r.read_only == True
     
+    s = InputParameterInt("s", "sname", 4, 1, min_value=0)
+    assert s.min_value == 0
+    assert s.max_value == math.inf
+    assert s.validate(10**30)
+    assert not s.validate(-1)
+    assert not s.validate(1.5)
+    assert p.validate(-10**30)
+    
     with pytest.raises(TypeError):
         InputParameterInt("p", "pname", 4.1, 1)
     with pytest.raises(ValueError):
@@ -171,6 +223,14 @@ def test_parameter_int():
         q.set_value(1000)  # > max
     with pytest.raises(TypeError):
         p.set_value('x')  # > type
+    with pytest.raises(TypeError):
+        p.set_value(True)  # bool is not a number
+    with pytest.raises(TypeError):
+        InputParameterInt("b", "bname", True, 1)  # bool default
+    with pytest.raises(TypeError):
+        InputParameterInt("b", "bname", 1, 1, min_value=False)
+    with pytest.raises(TypeError):
+        InputParameterInt("b", "bname", 0, 1, max_value=True)
 
 
 def test_parameter_float():
@@ -192,6 +252,7 @@ def test_parameter_float():
     assert q.min_value == 0.0
     assert q.max_value == 100.0
     assert q.format_str == "%.3f"
+    assert q.format_value() == "5.000"
     
     r = InputParameterFloat("r", "rname", 4, 1, read_only=True,
                             min_value=0, max_value=10)
@@ -219,6 +280,32 @@ def test_parameter_float():
         q.set_value(1000)  # > max
     with pytest.raises(TypeError):
         p.set_value('x')  # > type
+    with pytest.raises(TypeError):
+        p.set_value(True)  # bool is not a number
+    with pytest.raises(TypeError):
+        InputParameterFloat("b", "bname", True, 1.0)  # bool default
+    with pytest.raises(TypeError):
+        InputParameterFloat("b", "bname", 1.0, 1, min_value=False)
+    with pytest.raises(TypeError):
+        InputParameterFloat("b", "bname", 0.0, 1, max_value=True)
+    
+    InputParameterFloat.set_values_bulk([p, q], [1.5, 50])
+    assert p.value == 1.5
+    assert q.value == 50
+    with pytest.raises(ValueError):
+        InputParameterFloat.set_values_bulk([p, q], [2.5, 500])  # > max
+    assert p.value == 1.5  # nothing set when one value is invalid
+    with pytest.raises(ValueError):
+        InputParameterFloat.set_values_bulk([p, q], [2.5])
+    assert InputParameterFloat.validate_batch([p, q, q], [1, 500, 'x']) \
+        == [True, False, False]
+    with pytest.raises(ValueError):
+        InputParameterFloat.validate_batch([p], [1.0, 5.0, 7.0])
+    
+    m = InputParameterMap("m", "mname", 1)
+    with pytest.raises(ValueError):
+        InputParameterFloat("f", "fname", -1, 1, parent=m, min_value=0)
+    assert "f" not in m.value  # not added when the checks fail
 
 
 def test_parameter_str():
@@ -239,6 +326,8 @@ def test_parameter_str():
         InputParameterStr("p", "pname", 4, 1)
     with pytest.raises(ValueError):
         r.set_value(4)  # read_only
+    with pytest.raises(ValueError, match="parameter r is read only"):
+        r.set_value('y')  # read_only
     with pytest.raises(ValueError):
         p.set_value(10)  # type
 
@@ -286,6 +375,9 @@ def test_parameter_quantity():
     assert q.max_si == 100.0
     assert q.format_str == "%.3f"
     assert q.type == Speed
+    assert q.bulk_validate([-1.0, 0.0, 50.0, 100.0, 100.5]) == \
+        [False, True, True, True, False]
+    assert p.bulk_validate([-math.inf, 0.0, 1E30]) == [True, True, True]
     
     r = InputParameterQuantity("r", "rname", Length(1.0, 'm'), 1,
         read_only=True, min_si=0, max_si=10)
@@ -327,8 +419,12 @@ def test_list():
     assert not p.read_only
     p.set_value("MD")
     assert p.value == "MD"
+    p.set_value("".join(["M", "D"]))
+    assert p.value is p.options[p.options.index("MD")]
     assert p.default_value == "CA"
     assert p.options == states
+    p.options.append("XX")
+    assert p.options == states  # options cannot be changed via the copy
     
     r = InputParameterSelectionList("r", "states", states, "CA", 1,
                                     read_only=True)
@@ -348,7 +444,7 @@ def test_list():
         p.set_value(4)
     with pytest.raises(ValueError):
         p.set_value('XX')
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="parameter r is read only"):
         r.set_value('MD')
 
 
@@ -6,7 +6,7 @@ import pytest
 
 from pydsol.core.pubsub import EventError
 from pydsol.core.pubsub import EventType, Event, TimedEvent, EventProducer, \
-    EventListener
+    EventListener, EventHandlerListener
 from pydsol.core.utils import DSOLError
 
 
@@ -133,6 +133,14 @@ def test_timed_event():
     
     # event with dict    
     e2: TimedEvent = TimedEvent(15.3, Defs.EVENTDICT, {"i": 3, "s": "abc"})
+    
+    # unchecked construction, as used by the fire methods
+    e3: TimedEvent = TimedEvent._create(2.5, Defs.EVENT, 'c')
+    assert type(e3) is TimedEvent
+    assert (e3.timestamp, e3.event_type, e3.content) == (2.5, Defs.EVENT, 'c')
+    e4: Event = Event._create(Defs.EVENT, 'd')
+    assert type(e4) is Event
+    assert (e4.event_type, e4.content) == (Defs.EVENT, 'd')
     assert e2.event_type == Defs.EVENTDICT
     assert e2.content == {"i": 3, "s": "abc"}
     assert e2.timestamp == 15.3
@@ -185,6 +193,8 @@ def test_event_producer():
     prod.add_listener(P.EVENT_PROD1, listener1)
     assert len(prod._listeners) == 1
     assert prod._listeners[P.EVENT_PROD1] == [listener1]
+    assert prod.has_listeners(P.EVENT_PROD1)
+    assert not prod.has_listeners(P.EVENT_PROD2)
     prod.add_listener(P.EVENT_PROD1, listener2)
     assert len(prod._listeners) == 1
     assert prod._listeners[P.EVENT_PROD1] == [listener1, listener2]
@@ -193,6 +203,7 @@ def test_event_producer():
     prod.remove_listener(P.EVENT_PROD1, listener1)
     prod.remove_listener(P.EVENT_PROD1, listener2)
     assert not prod.has_listeners()
+    assert not prod.has_listeners(P.EVENT_PROD1)
     
     # check remove_all behavior
     def add4():
@@ -381,6 +392,95 @@ def test_pub_sub_timed():
     assert listener2.value == 4
 
 
+def test_unsubscribe_in_notify():
+    
+    class U(EventProducer):
+        EVENT_TYPE_U: EventType = EventType("EVENT_U")
+
+    class L(EventListener):
+
+        def __init__(self, producer):
+            self.producer = producer
+            self.count = 0
+            
+        def notify(self, event:Event):
+            self.count += 1
+            self.producer.remove_listener(U.EVENT_TYPE_U, self)
+
+    producer = U()
+    listener1 = L(producer)
+    listener2 = L(producer)
+    producer.add_listener(U.EVENT_TYPE_U, listener1)
+    producer.add_listener(U.EVENT_TYPE_U, listener2)
+    producer.fire(U.EVENT_TYPE_U, None)
+    assert listener1.count == 1
+    assert listener2.count == 1
+    assert not producer.has_listeners()
+    producer.fire(U.EVENT_TYPE_U, None)
+    assert listener1.count == 1
+
+
+def test_handler_listener():
+    
+    class H(EventProducer):
+        EVENT_TYPE_A: EventType = EventType("EVENT_A")
+        EVENT_TYPE_B: EventType = EventType("EVENT_B")
+
+    class L(EventHandlerListener):
+
+        def __init__(self):
+            self.received = []
+            self._handlers = {H.EVENT_TYPE_A: self.on_a}
+            
+        def on_a(self, event:Event):
+            self.received.append(event.content)
+
+    producer = H()
+    listener = L()
+    producer.add_listener(H.EVENT_TYPE_A, listener)
+    producer.add_listener(H.EVENT_TYPE_B, listener)
+    producer.fire(H.EVENT_TYPE_A, 1)
+    producer.fire(H.EVENT_TYPE_B, 2)  # no handler: ignored
+    assert listener.received == [1]
+
+
+def test_fire_batch():
+    
+    class B(EventProducer):
+        EVENT_TYPE: EventType = EventType("EVENT")
+        EVENT_META: EventType = EventType("EVENT_META", {"i": int})
+
+    class L(EventListener):
+
+        def __init__(self):
+            self.received = []
+            
+        def notify(self, event:Event):
+            self.received.append(event)
+
+    producer = B()
+    listener = L()
+    producer.fire_batch(B.EVENT_TYPE, [1, 2])  # nobody listens
+    producer.add_listener(B.EVENT_TYPE, listener)
+    producer.add_listener(B.EVENT_META, listener)
+    producer.fire_batch(B.EVENT_TYPE, (c for c in [1, 2, 3]))
+    assert [e.content for e in listener.received] == [1, 2, 3]
+    assert not isinstance(listener.received[0], TimedEvent)
+    listener.received.clear()
+    producer.fire_batch(B.EVENT_TYPE, ["a", "b"], [1.0, 2])
+    assert [e.content for e in listener.received] == ["a", "b"]
+    assert [e.timestamp for e in listener.received] == [1.0, 2]
+    listener.received.clear()
+    with pytest.raises(EventError):
+        producer.fire_batch(B.EVENT_TYPE, [1, 2], [1.0])
+    # a wrong content anywhere in the batch fires no event at all
+    with pytest.raises(EventError):
+        producer.fire_batch(B.EVENT_META, [{"i": 1}, {"i": "x"}])
+    assert listener.received == []
+    producer.fire_batch(B.EVENT_META, [{"i": 1}, {"i": 2}])
+    assert len(listener.received) == 2
+
+
 def test_producer_errors():
 
     class Q(EventProducer):
@@ -407,10 +507,6 @@ def test_producer_errors():
         prod.remove_all_listeners(event_type="x", listener=listener1)
     with pytest.raises(EventError):
         prod.remove_all_listeners(event_type=Q.EVENT_PROD1, listener="xyz")
-    with pytest.raises(EventError):
-        prod.fire_event("xyz")
-    with pytest.raises(EventError):
-        prod.fire_timed_event("xyz")
 
     with pytest.raises(EventError):
         prod.fire(Q.EVENT_PROD2, "abc")
@@ -433,6 +529,32 @@ def test_producer_errors():
         prod.fire_timed(4, Q.EVENT_PROD2, {"i": 3, "s": "abc", "j": 5})
     with pytest.raises(EventError):
         prod.fire_timed(5, Q.EVENT_PROD2, {"i": "3", "s": "abc"})
+    with pytest.raises(EventError, match="key 'i' to be of type int"):
+        prod.fire(Q.EVENT_PROD2, {"i": "3", "s": "abc"})
+
+
+@pytest.mark.skipif(not __debug__, 
+                    reason="fire argument types are not checked under -O")
+def test_fire_type_errors():
+
+    class P(EventProducer):
+        EVENT_P = EventType("EVENT_P")
+
+    prod = P()
+    with pytest.raises(EventError):
+        prod.fire_event("xyz")
+    with pytest.raises(EventError):
+        prod.fire_timed_event("xyz")
+    with pytest.raises(EventError):
+        prod.fire("x", 1)
+    with pytest.raises(EventError):
+        prod.fire_timed(1.0, "x", 1)
+    with pytest.raises(EventError):
+        prod.fire_timed("x", P.EVENT_P, 1)
+    with pytest.raises(EventError):
+        prod.fire_batch(P.EVENT_P, [1], ["x"])
+    with pytest.raises(EventError):
+        prod.fire_batch("x", [1])
     
         
 if __name__ == '__main__':
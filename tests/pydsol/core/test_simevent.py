@@ -44,6 +44,7 @@ def test_create_event():
     assert e1.priority == SimEventInterface.NORMAL_PRIORITY
     assert e1.id >= 0
     assert e1.kwargs == {}
+    assert not hasattr(e1, "__dict__")
     
     # float time, kwargs, look at increment if id
     e2 = SimEvent(3.0, test, "m_arg1", 1, arg1="abc")
@@ -158,6 +159,18 @@ def test_execute_event():
     e4 = SimEvent(4.0, t1, "m_arg10")
     e4.execute()
     assert t1.val == "null"
+
+    # method with a positional argument
+    e5 = SimEvent(5.0, t1, "m_arg1", 5, "xyz")
+    assert e5.args == ("xyz",)
+    assert e5.kwargs == {}
+    e5.execute()
+    assert t1.val == "xyz"
+    
+    # method with too many positional arguments
+    with pytest.raises(DSOLError):
+        e51 = SimEvent(5.0, t1, "m_arg1", 5, "x", "y")
+        e51.execute()
     
     
 def test_event_special():
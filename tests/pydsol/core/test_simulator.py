@@ -2,10 +2,14 @@
 Test the Simulator classes for correct functioning.
 """ 
 
+import os
+import subprocess
+import sys
 from time import sleep
 
 import pytest
 
+from pydsol.core.eventlist import EventListHeap
 from pydsol.core.experiment import SingleReplication
 from pydsol.core.interfaces import SimulatorInterface, ReplicationInterface, \
     ModelInterface
@@ -13,7 +17,7 @@ from pydsol.core.model import DSOLModel
 from pydsol.core.pubsub import EventListener, Event, TimedEvent
 from pydsol.core.simevent import SimEvent
 from pydsol.core.simulator import DEVSSimulator, RunState, ReplicationState, \
-    DEVSSimulatorFloat
+    DEVSSimulatorFloat, ErrorStrategy
 from pydsol.core.units import Duration
 from pydsol.core.utils import DSOLError
 
@@ -37,6 +41,15 @@ def test_simulator_base():
     with pytest.raises(DSOLError):
         DEVSSimulator('sim2', Duration, 0.0)
 
+    # a provided event list is used by the simulator
+    eventlist = EventListHeap()
+    assert DEVSSimulator('sim3', float, 0.0, eventlist).eventlist() \
+        is eventlist
+    assert DEVSSimulatorFloat('sim4', eventlist).eventlist() is eventlist
+    assert isinstance(s.eventlist(), EventListHeap)
+    with pytest.raises(DSOLError):
+        DEVSSimulator('sim5', float, 0.0, [])
+
 
 def test_initialize():
 
@@ -250,6 +263,125 @@ def test_stop():
         simulator.cleanup()
 
 
+def test_inline():
+
+    class Model(DSOLModel):
+
+        def __init__(self, simulator: SimulatorInterface):
+            super().__init__(simulator)
+            self.count = 0
+            
+        def construct_model(self):
+            self.simulator.schedule_event_now(self, "inc")
+            
+        def inc(self):
+            self.count += 1
+            self.simulator.schedule_event_rel(10.0, self, "inc")
+
+    simulator: DEVSSimulator = DEVSSimulatorFloat('sim')
+    assert not simulator.inline
+    simulator.set_inline(True)
+    assert simulator.inline
+    model: ModelInterface = Model(simulator)
+    replication: ReplicationInterface = SingleReplication(
+        'rep', 0.0, 10.0, 100.0)
+    try:
+        simulator.initialize(model, replication)
+        # an inline run returns when the simulator has stopped
+        simulator.start()
+        assert model.count == 11  # (0, 10, ..., 100)
+        assert simulator.simulator_time == 100.0
+        assert simulator.run_state == RunState.ENDED
+        assert simulator.replication_state == ReplicationState.ENDED
+    finally:
+        simulator.cleanup()
+    
+    # the inline mode is fixed between initialize and cleanup
+    try:
+        simulator.initialize(Model(simulator), replication)
+        with pytest.raises(DSOLError):
+            simulator.set_inline(False)
+        with pytest.raises(DSOLError):
+            simulator.set_inline(True)
+        assert simulator.inline
+    finally:
+        simulator.cleanup()
+    simulator.set_inline(False)
+    assert not simulator.inline
+
+
+def test_run_outlives_main_thread():
+    """a run in the worker thread finishes after the main thread ended"""
+    script = """if True:
+        from pydsol.core.experiment import SingleReplication
+        from pydsol.core.model import DSOLModel
+        from pydsol.core.simulator import DEVSSimulatorFloat
+        
+        class Model(DSOLModel):
+            def construct_model(self):
+                self.count = 0
+                self.simulator.schedule_event_now(self, "inc")
+            def inc(self):
+                self.count += 1
+                if self.count == 50000:
+                    print("run done", flush=True)
+                else:
+                    self.simulator.schedule_event_rel(1.0, self, "inc")
+        
+        simulator = DEVSSimulatorFloat("sim")
+        simulator.initialize(Model(simulator), 
+                             SingleReplication("rep", 0.0, 0.0, 1.0e6))
+        simulator.start()
+        print("main done", flush=True)
+        """
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(os.path.dirname(
+        sys.modules[DEVSSimulator.__module__].__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(
+        [src] + ([env["PYTHONPATH"]] if "PYTHONPATH" in env else []))
+    result = subprocess.run([sys.executable, "-c", script], env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert "main done" in result.stdout
+    assert "run done" in result.stdout
+
+
+def test_error_strategy(capsys):
+
+    class Model(DSOLModel):
+
+        def __init__(self, simulator: SimulatorInterface):
+            super().__init__(simulator)
+            self.count = 0
+            
+        def construct_model(self):
+            self.simulator.schedule_event_now(self, "inc")
+            
+        def inc(self):
+            self.count += 1
+            self.simulator.schedule_event_rel(10.0, self, "inc")
+            raise ValueError("inc failed")
+
+    simulator: DEVSSimulator = DEVSSimulatorFloat('sim')
+    simulator.set_inline(True)
+    simulator.set_error_strategy(ErrorStrategy.LOG_AND_CONTINUE)
+    model: ModelInterface = Model(simulator)
+    replication: ReplicationInterface = SingleReplication(
+        'rep', 0.0, 10.0, 100.0)
+    try:
+        simulator.initialize(model, replication)
+        # a failing step is reported, and the simulator stops
+        simulator.step()
+        assert model.count == 1
+        assert simulator.run_state == RunState.STOPPED
+        assert "step got exception" in capsys.readouterr().err
+        # errors are only logged, and the run continues
+        simulator.start()
+        assert model.count == 11
+        assert capsys.readouterr().err == ""
+    finally:
+        simulator.cleanup()
+
+
 def test_start_events():
     """test the sequence of events from a simulation run"""
 
@@ -438,6 +570,11 @@ def test_devs_simulator():
     assert event3.priority == 2
     assert event3.time == 15.0
     assert event3.kwargs == {'nr': 27}
+    event4 = simulator.schedule_event_args(12.0, Target, "method1", (8,))
+    assert simulator.eventlist().size() == 4
+    assert event4.time == 12.0
+    assert event4.args == (8,)
+    assert event4.priority == SimEvent.NORMAL_PRIORITY
 
     with pytest.raises(DSOLError):
         simulator.schedule_event_now('Target', "method2")
@@ -447,6 +584,8 @@ def test_devs_simulator():
         simulator.schedule_event(SimEvent(5, 'Target', "method0"))
     with pytest.raises(DSOLError):
         simulator.schedule_event_rel(-5, 'Target', "method0")
+    with pytest.raises(DSOLError):
+        simulator.schedule_event_args(5, Target, "method1", (8,))
 
 if __name__ == "__main__":
     pytest.main()